@@ -122,7 +122,8 @@ class AdaptiveCompetitionProcessor:
                 'success', 'confirmed', 'complete', 'registered'
             ]
             
-            if any(indicator in page_text.lower() for indicator in success_indicators):
+            page_text_lower = page_text.lower()
+            if any(indicator in page_text_lower for indicator in success_indicators):
                 return "complete"
             
             # Check if we need to fill a form
@@ -5,6 +5,8 @@ Removes files that are not needed in the new MCP/CV-based system.
 """
 
 import os
+import sys
+import errno
 import shutil
 import argparse
 from pathlib import Path
@@ -63,6 +65,138 @@ ARCHIVE_FILES = [
     "src/utils/rejection_logger.py",
 ]
 
+# Directory names whose contents are never touched
+SKIP_DIRS = (".git", "venv", "__pycache__", "archive", "screenshots", "logs", "config")
+
+# Lookup structures derived from the lists above. Any file that matches an
+# archive prefix must share its first few characters, so checking that short
+# head against a set rules out most files before the prefix comparison.
+_ARCHIVE_HEAD_LEN = min(len(path) for path in ARCHIVE_FILES)
+_ARCHIVE_HEADS = frozenset(path[:_ARCHIVE_HEAD_LEN] for path in ARCHIVE_FILES)
+_ARCHIVE_PREFIXES = tuple(ARCHIVE_FILES)
+_ESSENTIAL_SET = frozenset(ESSENTIAL_FILES)
+
+# File categories returned by _classify_file
+KEEP, ARCHIVE, REMOVE = range(3)
+
+def _is_archive_file(file):
+    """Return True if the relative path belongs to the legacy archive set"""
+    if file[:_ARCHIVE_HEAD_LEN] not in _ARCHIVE_HEADS:
+        return False
+    return file.startswith(_ARCHIVE_PREFIXES)
+
+def _classify_file(file):
+    """Return KEEP, ARCHIVE or REMOVE for a workspace-relative path"""
+    if file in _ESSENTIAL_SET:
+        return KEEP
+    if _is_archive_file(file):
+        return ARCHIVE
+    return REMOVE
+
+def _strip_dot_prefix(file):
+    """Turn a "./name" workspace path into a plain relative path"""
+    return file[2:] if file.startswith("./") else file
+
+def _copy_file_fast(src_path, dst_path):
+    """
+    Copy a file's bytes in kernel space where the platform allows it.
+    
+    Args:
+        src_path: Path of the file to copy
+        dst_path: Destination path (overwritten if it exists)
+    """
+    with open(src_path, "rb") as fsrc, open(dst_path, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            if hasattr(os, "copy_file_range"):
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            elif hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+                offset = 0
+                while remaining > 0:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+            else:
+                shutil.copyfileobj(fsrc, fdst)
+                remaining = 0
+        except OSError:
+            # Kernel copy not supported for this pair of files, copy in userspace
+            remaining = 1
+        if remaining > 0:
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src_path, dst_path)
+
+def _move_file(src_path, dst_path):
+    """
+    Move a file, renaming in place when possible.
+    
+    Args:
+        src_path: Path of the file to move
+        dst_path: Destination path
+    """
+    try:
+        os.replace(src_path, dst_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Source and archive live on different devices, copy then remove
+        _copy_file_fast(src_path, dst_path)
+        os.remove(src_path)
+
+def _scan_workspace(root_dir):
+    """
+    Collect the relative paths of all files in the workspace.
+    
+    Directories matching SKIP_DIRS are pruned before they are listed, so
+    large trees such as .git or venv are never walked.
+    
+    Args:
+        root_dir: Workspace root to scan
+        
+    Returns:
+        List of paths relative to root_dir ("./name" for top-level files)
+    """
+    all_files = []
+    stack = [(str(root_dir), "")]
+    while stack:
+        path, rel_root = stack.pop()
+        if any(skip in path for skip in SKIP_DIRS):
+            continue
+        
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # Like os.walk, list symlinked directories but never descend into them
+                        if not entry.is_symlink():
+                            subdirs.append(entry)
+                    elif rel_root:
+                        all_files.append(f"{rel_root}/{entry.name}")
+                    else:
+                        all_files.append(f"./{entry.name}")
+        except OSError:
+            continue
+        
+        for entry in reversed(subdirs):
+            sub_rel = f"{rel_root}/{entry.name}" if rel_root else entry.name
+            stack.append((entry.path, sub_rel))
+    
+    return all_files
+
 def cleanup_workspace(dry_run=True, archive=True):
     """
     Clean up the workspace by removing files not needed in the new system.
@@ -81,38 +215,16 @@ def cleanup_workspace(dry_run=True, archive=True):
         print(f"Created archive directory at: {archive_dir}")
     
     # Get all files in the workspace
-    all_files = []
-    for root, dirs, files in os.walk(root_dir):
-        # Skip directories we don't want to touch
-        if any(skip in root for skip in [".git", "venv", "__pycache__", "archive", "screenshots", "logs", "config"]):
-            continue
-        
-        # Convert to relative path
-        rel_root = os.path.relpath(root, root_dir)
-        rel_root = "" if rel_root == "." else rel_root
-        
-        for file in files:
-            if rel_root:
-                rel_path = os.path.join(rel_root, file).replace("\\", "/")
-            else:
-                rel_path = f"./{file}"
-            all_files.append(rel_path)
+    all_files = _scan_workspace(root_dir)
     
     # Identify files to keep, archive, and remove
     files_to_keep = []
     files_to_archive = []
     files_to_remove = []
+    buckets = {KEEP: files_to_keep, ARCHIVE: files_to_archive, REMOVE: files_to_remove}
     
     for file in all_files:
-        # Check if file is in essential files
-        if file in ESSENTIAL_FILES:
-            files_to_keep.append(file)
-        # Check if file is to be archived
-        elif any(file == archive_file or file.startswith(archive_file) for archive_file in ARCHIVE_FILES):
-            files_to_archive.append(file)
-        # Otherwise, mark for removal
-        else:
-            files_to_remove.append(file)
+        buckets[_classify_file(file)].append(file)
     
     # Print summary
     print(f"\nTotal files analyzed: {len(all_files)}")
@@ -140,25 +252,34 @@ def cleanup_workspace(dry_run=True, archive=True):
             print("Cleanup cancelled.")
             return
         
+        # Absolute paths are only built here, once the cleanup is confirmed
+        root_str = str(root_dir)
+        
         # Perform archive operation
         if archive and files_to_archive:
+            archive_str = str(archive_dir)
+            # Track directories already created so each is only made once
+            made_dirs = set()
             for file in files_to_archive:
-                src_path = root_dir / file.lstrip("./")
-                dst_path = archive_dir / file.lstrip("./")
-                dst_dir = dst_path.parent
-                dst_dir.mkdir(parents=True, exist_ok=True)
+                rel = _strip_dot_prefix(file)
+                src_path = os.path.join(root_str, rel)
+                dst_path = os.path.join(archive_str, rel)
+                dst_dir = os.path.dirname(dst_path)
+                if dst_dir not in made_dirs:
+                    os.makedirs(dst_dir, exist_ok=True)
+                    made_dirs.add(dst_dir)
                 print(f"Archiving: {file}")
-                shutil.copy2(src_path, dst_path)
-                
-                # Remove the original
-                os.remove(src_path)
+                _move_file(src_path, dst_path)
         
         # Perform remove operation
         for file in files_to_remove:
-            file_path = root_dir / file.lstrip("./")
+            file_path = os.path.join(root_str, _strip_dot_prefix(file))
             print(f"Removing: {file}")
-            if file_path.is_file():
+            # Unlink directly instead of stat-ing first; one syscall per file
+            try:
                 os.remove(file_path)
+            except (FileNotFoundError, IsADirectoryError):
+                pass
         
         print("\nCleanup completed!")
     else:
@@ -5,13 +5,18 @@ Combines DOM inspection and computer vision for robust competition entry
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import time
 import os
+import re
 import sys
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dotenv import load_dotenv
@@ -20,7 +25,7 @@ import cv2
 import numpy as np
 from PIL import Image
 import pytesseract
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 
 # Configure Tesseract path for Windows
 if sys.platform == "win32":
@@ -31,8 +36,21 @@ if sys.platform == "win32":
         sys.stderr = codecs.getwriter("utf-8")(sys.stderr.detach())
     pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
 
-# Configure logging
+# Prefer in-process Tesseract bindings; pytesseract spawns a process per call
+try:
+    from tesserocr import PyTessBaseAPI, PSM
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Load credentials from .env file once at import
+load_dotenv()
+
+# Create output directories once at startup
 os.makedirs('logs', exist_ok=True)
+os.makedirs('screenshots', exist_ok=True)
+
+# Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -43,13 +61,265 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Form controls considered during DOM detection
+FORM_FIELD_SELECTOR = 'input[type="text"], input[type="email"], input[name], textarea, input[type="checkbox"], select'
+
+# Attribute used to tag detected fields so they can be located again for filling
+FIELD_ID_ATTR = 'data-auto-entry-id'
+
+# Collects attributes, bounding boxes and labels for all form fields in one call.
+# Labels come from the `for`/wrapping association first, then from the first
+# label within 150px horizontally and 50px vertically of the field. Visible
+# labels are bucketed into a 150x50 grid so each lookup only inspects the
+# 3x3 neighbouring cells instead of every label on the page.
+DETECT_FORM_FIELDS_JS = """
+    (selector) => {
+        const CELL_W = 150, CELL_H = 50;
+        const grid = new Map();
+        Array.from(document.querySelectorAll('label')).forEach((label, order) => {
+            if (label.getClientRects().length === 0) {
+                return;
+            }
+            const rect = label.getBoundingClientRect();
+            const key = Math.floor(rect.x / CELL_W) + ',' + Math.floor(rect.y / CELL_H);
+            if (!grid.has(key)) {
+                grid.set(key, []);
+            }
+            grid.get(key).push({label, order, x: rect.x, y: rect.y});
+        });
+        const nearestLabel = (rect) => {
+            const cx = Math.floor(rect.x / CELL_W), cy = Math.floor(rect.y / CELL_H);
+            let best = null;
+            for (let dx = -1; dx <= 1; dx++) {
+                for (let dy = -1; dy <= 1; dy++) {
+                    for (const l of grid.get((cx + dx) + ',' + (cy + dy)) || []) {
+                        if (Math.abs(l.x - rect.x) < CELL_W && Math.abs(l.y - rect.y) < CELL_H &&
+                            (best === null || l.order < best.order)) {
+                            best = l;
+                        }
+                    }
+                }
+            }
+            return best;
+        };
+        const records = [];
+        document.querySelectorAll(selector).forEach((el, idx) => {
+            if (el.getClientRects().length === 0) {
+                return;
+            }
+            const rect = el.getBoundingClientRect();
+            let labelText = '';
+            if (el.labels && el.labels.length) {
+                labelText = el.labels[0].innerText;
+            }
+            if (!labelText) {
+                const nearby = nearestLabel(rect);
+                if (nearby) {
+                    labelText = nearby.label.innerText;
+                }
+            }
+            el.setAttribute('""" + FIELD_ID_ATTR + """', String(idx));
+            records.push({
+                id: idx,
+                name: el.getAttribute('name') || '',
+                placeholder: el.getAttribute('placeholder') || '',
+                input_type: el.getAttribute('type') || 'text',
+                tag_name: el.tagName.toLowerCase(),
+                label: labelText || '',
+                x: rect.x,
+                y: rect.y,
+                width: rect.width,
+                height: rect.height
+            });
+        });
+        return records;
+    }
+"""
+
+# Sets values on fields tagged by DETECT_FORM_FIELDS_JS and fires the events
+# frameworks listen for. Returns {id: true} for each field whose value stuck.
+# Inputs that are not text-like (radio, submit, hidden, image...) are matched by
+# input[name] but are never given a value here; they are left to _fill_field.
+BATCH_FILL_JS = """
+    ({attr, fields}) => {
+        const textTypes = new Set(['text', 'email', 'tel', 'url', 'search', 'password', 'number',
+                                   'date', 'datetime-local', 'month', 'week', 'time']);
+        const applied = {};
+        for (const [id, spec] of Object.entries(fields)) {
+            const el = document.querySelector(`[${attr}="${id}"]`);
+            if (!el) {
+                continue;
+            }
+            if (spec.kind === 'checkbox') {
+                if (el.checked !== spec.value) {
+                    el.click();
+                }
+                applied[id] = el.checked === spec.value;
+            } else if (spec.kind === 'select') {
+                const options = Array.from(el.options);
+                const match = options.find(o => o.value === spec.value) ||
+                    options.find(o => o.text.trim() === spec.value) ||
+                    options[0];
+                if (!match) {
+                    continue;
+                }
+                el.value = match.value;
+                el.dispatchEvent(new Event('input', {bubbles: true}));
+                el.dispatchEvent(new Event('change', {bubbles: true}));
+                applied[id] = el.value === match.value;
+            } else {
+                if (el.tagName === 'INPUT' && !textTypes.has(el.type)) {
+                    continue;
+                }
+                // Use the prototype setter so framework-controlled inputs see the change
+                const proto = Object.getPrototypeOf(el);
+                const descriptor = Object.getOwnPropertyDescriptor(proto, 'value');
+                if (descriptor && descriptor.set) {
+                    descriptor.set.call(el, spec.value);
+                } else {
+                    el.value = spec.value;
+                }
+                el.dispatchEvent(new Event('input', {bubbles: true}));
+                el.dispatchEvent(new Event('change', {bubbles: true}));
+                applied[id] = el.value === spec.value;
+            }
+        }
+        return applied;
+    }
+"""
+
+# Submit controls matched in a single query; the first match in document order wins
+SUBMIT_SELECTOR = (
+    'input[type="submit"], button[type="submit"], button.btn-primary, button.primary, '
+    '.submit-button, #submit, input[value="Submit" i], input[value="Enter" i]'
+)
+
+# Button text tried when no submit control matches SUBMIT_SELECTOR
+SUBMIT_BUTTON_TEXT = re.compile(r'submit|enter|send', re.I)
+
+# Cheap check for whether a page could hold an entry form at all. Iframes count
+# because embedded widgets are invisible to DOM detection but not to CV. Pages
+# with very little markup are treated as error pages.
+HAS_FORM_CONTENT_JS = """
+    () => document.documentElement.outerHTML.length > 2000 && (
+        !!document.querySelector('form, [role=form], iframe') ||
+        document.querySelectorAll('input, textarea, select').length > 0
+    )
+"""
+
+# Returns the first success indicator found in the visible page text, plus the
+# current URL, so only a short result crosses back from the browser
+FIND_SUCCESS_INDICATOR_JS = """
+    (indicators) => {
+        const text = (document.body ? document.body.innerText : '').toLowerCase();
+        return {
+            indicator: indicators.find(i => text.includes(i)) || null,
+            url: location.href
+        };
+    }
+"""
+
+# JPEG quality for debug screenshots; CV screenshots stay lossless PNG
+SCREENSHOT_JPEG_QUALITY = 70
+
+# Image requests aborted in pooled contexts when block_images is enabled
+BLOCKED_IMAGE_PATTERN = '**/*.{png,jpg,jpeg,gif,webp,svg}'
+
+# Upper bound on waiting for network idle (ms); ad-heavy pages may never settle,
+# so an element-based readiness check is used where one is available
+NETWORK_IDLE_TIMEOUT = 1500
+READY_SELECTOR_TIMEOUT = 5000
+
+# Elements that show a competition page is ready to be filled in
+FORM_READY_SELECTOR = 'form, input, textarea'
+
+# How long to wait for a login outcome after submitting credentials (ms)
+LOGIN_WAIT_TIMEOUT = 30000
+
+# Screenshots larger than this (longest side, px) are downsampled by
+# CV_DOWNSAMPLE_FACTOR before edge detection
+CV_DOWNSAMPLE_MIN_SIZE = 1200
+CV_DOWNSAMPLE_FACTOR = 2
+
+# Minimum stroke lengths (px, in the image passed to morphology) for a line
+# to count as part of an input border rather than text
+CV_MIN_HORIZONTAL_LINE = 25
+CV_MIN_VERTICAL_LINE = 7
+
+# Labels are read from a strip this tall above a field, falling back to one
+# this wide to its left (px)
+LABEL_ABOVE_HEIGHT = 30
+LABEL_LEFT_WIDTH = 200
+
+# Crops with lower pixel variance than this are blank and skipped without OCR
+OCR_MIN_VARIANCE = 100
+
+# Below this many candidate regions OCR runs inline rather than in a thread pool
+OCR_PARALLEL_MIN_REGIONS = 4
+
+# Ordered keyword rules for field classification; the first matching rule wins
+FIELD_TYPE_RULES = (
+    ('email', ('email', 'e-mail', 'mail')),
+    ('first_name', ('first', 'given', 'fname', 'firstname')),
+    ('last_name', ('last', 'surname', 'family', 'lname', 'lastname')),
+    ('name', ('name',)),
+    ('phone', ('phone', 'mobile', 'tel', 'number')),
+    ('address', ('address', 'street')),
+    ('city', ('city', 'town')),
+    ('state', ('state', 'province')),
+    ('postal_code', ('zip', 'postal', 'postcode')),
+    ('terms', ('terms', 'conditions', 'agree', 'accept')),
+    ('checkbox', ('marketing', 'newsletter', 'subscribe')),
+    ('comments', ('custname', 'customer', 'comments', 'message')),
+)
+
+# All classification keywords compiled into one pattern. The lookahead reports a
+# match at every position, and alternatives are listed in rule order so the
+# highest-priority keyword starting at a position is the one reported.
+_FIELD_KEYWORD_RULE = {
+    keyword: index
+    for index, (_, keywords) in reversed(list(enumerate(FIELD_TYPE_RULES)))
+    for keyword in keywords
+}
+_FIELD_KEYWORD_PATTERN = re.compile(
+    '(?=(' + '|'.join(
+        re.escape(keyword) for _, keywords in FIELD_TYPE_RULES for keyword in keywords
+    ) + '))'
+)
+
+@lru_cache(maxsize=2048)
+def _classify_field_type(label_text: str) -> str:
+    """Classify the type of form field based on label text"""
+    label_lower = label_text.lower()
+    
+    # Scan the label once and visit the matched rules in priority order
+    matched_rules = sorted({
+        _FIELD_KEYWORD_RULE[match.group(1)]
+        for match in _FIELD_KEYWORD_PATTERN.finditer(label_lower)
+    })
+    
+    for rule_index in matched_rules:
+        field_type = FIELD_TYPE_RULES[rule_index][0]
+        if field_type == 'name':
+            # Assume general "name" field is first name
+            if 'user' in label_lower:
+                continue
+            return 'first_name'
+        if field_type == 'comments' and 'name' in label_lower:
+            # "custname"/"customer name" style fields
+            return 'first_name'
+        return field_type
+    
+    return 'unknown'
+
 class CompetitionAutoEntry:
     """
     Main competition auto-entry system
     Handles competition discovery, form detection, and entry
     """
     
-    def __init__(self, config_path: str = "config/config.json", headless: bool = False):
+    def __init__(self, config_path: str = "config/config.json", headless: bool = False,
+                 pool_size: int = 2, block_images: bool = True):
         self.config = self._load_config(config_path)
         self.headless = headless
         self.cv_detector = ComputerVisionFormDetector()
@@ -57,6 +327,24 @@ class CompetitionAutoEntry:
         self.browser = None
         self.context = None
         
+        # Warm browser contexts reused across competition entries
+        self.pool_size = pool_size
+        self.block_images = block_images
+        self.context_pool: Optional[asyncio.Queue] = None
+        self._pooled_contexts: List[BrowserContext] = []
+        self._context_versions: Dict[BrowserContext, int] = {}
+        # Cookies/local storage captured after login, shared with pooled contexts
+        self._storage_state: Optional[Dict] = None
+        self._storage_version = 0
+        
+        # Hash and path of the last screenshot written, used to skip duplicates
+        self._last_screenshot_hash: Optional[str] = None
+        self._last_screenshot_path: Optional[str] = None
+        # Screenshot names are the run's start time plus a counter, so captures
+        # taken within the same second no longer overwrite each other
+        self._run_stamp = int(time.time())
+        self._screenshot_counter = 0
+        
         # Load personal info from config
         self.personal_info = self.config.get('personal_info', {})
         if not self.personal_info:
@@ -99,10 +387,55 @@ class CompetitionAutoEntry:
             args=['--no-sandbox', '--disable-dev-shm-usage']
         )
         self.context = await self.browser.new_context()
-        logger.info("Browser initialized")
+        
+        self.context_pool = asyncio.Queue()
+        for _ in range(self.pool_size):
+            self.context_pool.put_nowait(await self._new_pooled_context())
+        logger.info(f"Browser initialized with {self.pool_size} warm contexts")
+    
+    async def _new_pooled_context(self) -> BrowserContext:
+        """Create a context for the entry pool carrying the current login state"""
+        context = await self.browser.new_context(storage_state=self._storage_state)
+        if self.block_images:
+            await context.route(BLOCKED_IMAGE_PATTERN, lambda route: route.abort())
+        self._pooled_contexts.append(context)
+        self._context_versions[context] = self._storage_version
+        return context
+    
+    async def _acquire_context(self) -> BrowserContext:
+        """Take a warm context from the pool, refreshing it if the login state changed"""
+        context = await self.context_pool.get()
+        if self._context_versions.get(context) != self._storage_version:
+            # Create the replacement before closing the stale context, so a
+            # failure here hands the slot back instead of shrinking the pool
+            try:
+                fresh = await self._new_pooled_context()
+            except Exception:
+                self.context_pool.put_nowait(context)
+                raise
+            try:
+                await self._discard_context(context)
+            except Exception as e:
+                logger.warning(f"Failed to close stale context: {e}")
+            context = fresh
+        return context
+    
+    async def _release_context(self, context: BrowserContext):
+        """Return a context to the pool for the next entry"""
+        self.context_pool.put_nowait(context)
+    
+    async def _discard_context(self, context: BrowserContext):
+        """Close a pooled context and forget about it"""
+        self._context_versions.pop(context, None)
+        if context in self._pooled_contexts:
+            self._pooled_contexts.remove(context)
+        await context.close()
     
     async def close(self):
         """Close Playwright browser"""
+        for context in list(self._pooled_contexts):
+            await self._discard_context(context)
+        self.cv_detector.close()
         if self.context:
             await self.context.close()
         if self.browser:
@@ -111,18 +444,64 @@ class CompetitionAutoEntry:
             await self.playwright.stop()
         logger.info("Browser closed")
     
+    def _next_screenshot_id(self) -> str:
+        """Return a unique suffix for the next screenshot file name"""
+        self._screenshot_counter += 1
+        return f"{self._run_stamp}_{self._screenshot_counter}"
+    
+    async def _screenshot(self, page: Page, path: str) -> str:
+        """
+        Take a screenshot, skipping the disk write if it matches the previous one
+        
+        Paths ending in .jpg are captured as JPEG, anything else as PNG.
+        Returns the path of the file that holds the image.
+        """
+        if path.endswith('.jpg'):
+            buf = await page.screenshot(type='jpeg', quality=SCREENSHOT_JPEG_QUALITY)
+        else:
+            buf = await page.screenshot()
+        
+        digest = hashlib.sha256(buf).hexdigest()
+        if digest == self._last_screenshot_hash and self._last_screenshot_path:
+            logger.debug(f"Screenshot unchanged, reusing {self._last_screenshot_path}")
+            return self._last_screenshot_path
+        
+        with open(path, 'wb') as f:
+            f.write(buf)
+        self._last_screenshot_hash = digest
+        self._last_screenshot_path = path
+        return path
+    
+    async def _wait_until_ready(self, page: Page, selector: Optional[str] = None):
+        """
+        Give the page a short chance to go network idle, then optionally wait
+        for an element that shows it is usable. Timeouts are not errors.
+        """
+        try:
+            await page.wait_for_load_state('networkidle', timeout=NETWORK_IDLE_TIMEOUT)
+        except Exception:
+            pass
+        if selector:
+            try:
+                await page.wait_for_selector(selector, timeout=READY_SELECTOR_TIMEOUT)
+            except Exception:
+                logger.debug(f"Ready selector not found: {selector}")
+    
     async def authenticate(self, site: str):
         """Authenticate with a competition site"""
         logger.info(f"Authenticating with {site}...")
         
-        # Load credentials from .env file
-        load_dotenv()
-        
         if site.lower() == "competitioncloud":
-            return await self._authenticate_competition_cloud()
+            success = await self._authenticate_competition_cloud()
         else:
             logger.warning(f"No authentication method available for {site}")
             return False
+        
+        if success:
+            # Pooled contexts pick up the new session the next time they are used
+            self._storage_state = await self.context.storage_state()
+            self._storage_version += 1
+        return success
     
     async def _authenticate_competition_cloud(self):
         """Authenticate with CompetitionCloud"""
@@ -140,15 +519,14 @@ class CompetitionAutoEntry:
                 # Add longer timeout and progress indicator
                 logger.info("Waiting for login page to load (can take a minute)...")
                 await login_page.goto("https://www.competitioncloud.com.au/Account/Login", timeout=120000)
-                logger.info("Login page loaded, waiting for network to be idle...")
-                await login_page.wait_for_load_state('networkidle', timeout=60000)
+                logger.info("Login page loaded, waiting for login form...")
+                await self._wait_until_ready(login_page, 'input[name="Email"]')
             except Exception as e:
                 logger.warning(f"Timeout while waiting for page to load fully: {e}")
                 logger.info("Attempting to continue anyway...")
                 
             # Take a screenshot of the login page
-            os.makedirs("screenshots", exist_ok=True)
-            await login_page.screenshot(path="screenshots/login_page.png")
+            await self._screenshot(login_page, "screenshots/login_page.jpg")
             
             # Check if we have login fields
             email_field = await login_page.query_selector('input[name="Email"]')
@@ -167,7 +545,7 @@ class CompetitionAutoEntry:
             await login_page.fill('input[name="Password"]', clean_password)
             
             # Take screenshot before clicking login
-            await login_page.screenshot(path="screenshots/before_login.png")
+            await self._screenshot(login_page, "screenshots/before_login.jpg")
             logger.info("Clicking login button")
             
             # Click login button
@@ -175,48 +553,51 @@ class CompetitionAutoEntry:
             
             # Wait for successful login indicators
             try:
-                await login_page.wait_for_load_state('networkidle', timeout=30000)
-                await login_page.screenshot(path="screenshots/after_login_click.png")
+                await self._wait_until_ready(login_page)
+                await self._screenshot(login_page, "screenshots/after_login_click.jpg")
                 
-                for i in range(30):
-                    logger.info(f"Waiting for login completion (attempt {i+1}/30)")
-                    # Check for logout link
-                    logout_link = await login_page.query_selector('a:has-text("Logout")')
-                    if logout_link:
-                        logger.info("Found logout link - login successful")
-                        await login_page.screenshot(path="screenshots/login_success.png")
-                        await login_page.close()
-                        return True
-                    
-                    # Check for user profile
-                    user_profile = await login_page.query_selector('.user-profile')
-                    if user_profile:
-                        logger.info("Found user profile - login successful")
-                        await login_page.screenshot(path="screenshots/login_success.png")
-                        await login_page.close()
-                        return True
-                    
-                    # Check current URL to see if we're redirected to the dashboard
-                    current_url = login_page.url
-                    if "dashboard" in current_url.lower() or "account" in current_url.lower():
-                        logger.info(f"Redirected to {current_url} - login successful")
-                        await login_page.screenshot(path="screenshots/login_success.png")
-                        await login_page.close()
-                        return True
-                    
-                    # Check for login error messages
-                    error_message = await login_page.query_selector('.validation-summary-errors')
-                    if error_message:
-                        error_text = await error_message.inner_text()
-                        logger.error(f"Login error: {error_text}")
-                        await login_page.screenshot(path="screenshots/login_error.png")
-                        await login_page.close()
-                        return False
-                    
-                    await asyncio.sleep(1)
+                # Race the login outcome indicators; Playwright resolves each wait
+                # as soon as it matches instead of us polling every second
+                logger.info("Waiting for login completion...")
+                indicators = {
+                    'logout': asyncio.create_task(login_page.wait_for_selector('a:has-text("Logout")', timeout=LOGIN_WAIT_TIMEOUT)),
+                    'profile': asyncio.create_task(login_page.wait_for_selector('.user-profile', timeout=LOGIN_WAIT_TIMEOUT)),
+                    'redirect': asyncio.create_task(login_page.wait_for_url(
+                        lambda u: "dashboard" in u.lower() or "account" in u.lower(), timeout=LOGIN_WAIT_TIMEOUT)),
+                    'error': asyncio.create_task(login_page.wait_for_selector('.validation-summary-errors', timeout=LOGIN_WAIT_TIMEOUT)),
+                }
+                outcome = None
+                pending = set(indicators.values())
+                while pending and outcome is None:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for name, task in indicators.items():
+                        if task in done and task.exception() is None:
+                            outcome = name
+                            break
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                
+                if outcome == 'logout':
+                    logger.info("Found logout link - login successful")
+                elif outcome == 'profile':
+                    logger.info("Found user profile - login successful")
+                elif outcome == 'redirect':
+                    logger.info(f"Redirected to {login_page.url} - login successful")
+                elif outcome == 'error':
+                    error_text = await indicators['error'].result().inner_text()
+                    logger.error(f"Login error: {error_text}")
+                    await self._screenshot(login_page, "screenshots/login_error.jpg")
+                    await login_page.close()
+                    return False
+                
+                if outcome is not None:
+                    await self._screenshot(login_page, "screenshots/login_success.jpg")
+                    await login_page.close()
+                    return True
                 
                 logger.error("Authentication timeout - login indicators not found")
-                await login_page.screenshot(path="screenshots/login_failed.png")
+                await self._screenshot(login_page, "screenshots/login_failed.jpg")
                 # Dump the page content for debugging
                 page_content = await login_page.content()
                 with open("screenshots/failed_login_page.html", "w", encoding="utf-8") as f:
@@ -225,13 +606,13 @@ class CompetitionAutoEntry:
                 return False
             except Exception as e:
                 logger.error(f"Error waiting for login completion: {e}")
-                await login_page.screenshot(path="screenshots/login_exception.png")
+                await self._screenshot(login_page, "screenshots/login_exception.jpg")
                 await login_page.close()
                 return False
         except Exception as e:
             logger.error(f"Error during authentication: {e}")
             if 'login_page' in locals():
-                await login_page.screenshot(path="screenshots/auth_exception.png")
+                await self._screenshot(login_page, "screenshots/auth_exception.jpg")
                 await login_page.close()
             return False
     
@@ -250,19 +631,19 @@ class CompetitionAutoEntry:
                 logger.error(f"Authentication with {site} failed, cannot continue")
                 return False
         
+        context = await self._acquire_context()
         try:
             # Open competition page
-            page = await self.context.new_page()
+            page = await context.new_page()
             await page.goto(url, timeout=60000, wait_until='domcontentloaded')
-            await page.wait_for_load_state('networkidle', timeout=30000)
-            
-            # Take initial screenshot
-            os.makedirs("screenshots", exist_ok=True)
-            timestamp = int(time.time())
-            await page.screenshot(path=f"screenshots/competition_{timestamp}.png")
+            await self._wait_until_ready(page, FORM_READY_SELECTOR)
             
-            # Detect form fields (DOM first, CV as fallback)
-            form_fields = await self._detect_form_fields(page)
+            # Take initial screenshot and detect form fields (DOM first, CV as
+            # fallback) concurrently; neither depends on the other
+            _, form_fields = await asyncio.gather(
+                self._screenshot(page, f"screenshots/competition_{self._next_screenshot_id()}.jpg"),
+                self._detect_form_fields(page)
+            )
             
             if not form_fields:
                 logger.warning("No form fields detected")
@@ -289,8 +670,7 @@ class CompetitionAutoEntry:
             success = await self._verify_submission_success(page)
             
             # Take final screenshot
-            timestamp = int(time.time())
-            await page.screenshot(path=f"screenshots/confirmation_{timestamp}.png")
+            await self._screenshot(page, f"screenshots/confirmation_{self._next_screenshot_id()}.jpg")
             
             await page.close()
             return success
@@ -300,6 +680,8 @@ class CompetitionAutoEntry:
             if 'page' in locals():
                 await page.close()
             return False
+        finally:
+            await self._release_context(context)
     
     async def _detect_form_fields(self, page: Page) -> List[Dict]:
         """Detect form fields using DOM inspection and computer vision"""
@@ -310,10 +692,20 @@ class CompetitionAutoEntry:
             logger.info(f"Detected {len(dom_fields)} form fields via DOM")
             return dom_fields
         
+        # Don't spend a screenshot and OCR on pages that cannot hold a form
+        try:
+            has_form = await page.evaluate(HAS_FORM_CONTENT_JS)
+        except Exception as e:
+            logger.warning(f"Form pre-check failed, trying computer vision anyway: {e}")
+            has_form = True
+        if not has_form:
+            logger.info("Page has no form content, skipping computer vision")
+            return []
+        
         # Fallback to computer vision
         logger.info("Falling back to computer vision for form detection")
-        screenshot_path = f"screenshots/form_detection_{int(time.time())}.png"
-        await page.screenshot(path=screenshot_path)
+        screenshot_path = f"screenshots/form_detection_{self._next_screenshot_id()}.png"
+        screenshot_path = await self._screenshot(page, screenshot_path)
         
         cv_fields = self.cv_detector.detect_form_fields(screenshot_path)
         logger.info(f"Detected {len(cv_fields)} form fields via computer vision")
@@ -325,84 +717,52 @@ class CompetitionAutoEntry:
         try:
             form_fields = []
             
-            # Find all input elements (text, email, checkboxes) and textareas
-            inputs = await page.query_selector_all('input[type="text"], input[type="email"], input[name], textarea, input[type="checkbox"], select')
+            # Read every field's attributes, position and label in a single round-trip
+            records = await page.evaluate(DETECT_FORM_FIELDS_JS, FORM_FIELD_SELECTOR)
             
-            for input_elem in inputs:
-                try:
-                    # Get element properties
-                    name = await input_elem.get_attribute('name') or ''
-                    placeholder = await input_elem.get_attribute('placeholder') or ''
-                    input_type = await input_elem.get_attribute('type') or 'text'
-                    tag_name = await input_elem.evaluate('el => el.tagName.toLowerCase()')
-                    
-                    # Get element position
-                    box = await input_elem.bounding_box()
-                    if not box:
-                        continue
-                    
-                    # Try to find associated label
-                    label_text = ''
-                    try:
-                        # Look for label by 'for' attribute
-                        input_id = await input_elem.get_attribute('id')
-                        if input_id:
-                            label = await page.query_selector(f'label[for="{input_id}"]')
-                            if label:
-                                label_text = await label.inner_text()
-                        
-                        # If no label found, look for nearby labels
-                        if not label_text:
-                            nearby_labels = await page.query_selector_all('label')
-                            for label in nearby_labels:
-                                label_box = await label.bounding_box()
-                                if label_box:
-                                    # Check if label is near the input
-                                    if (abs(label_box['x'] - box['x']) < 150 and 
-                                        abs(label_box['y'] - box['y']) < 50):
-                                        label_text = await label.inner_text()
-                                        break
-                    except Exception as e:
-                        logger.debug(f"Error finding label: {e}")
-                    
-                    # Determine field type
-                    if input_type == 'checkbox':
-                        field_type = 'checkbox'
-                        if any(term in label_text.lower() for term in ['terms', 'conditions', 'agree', 'accept']):
-                            field_type = 'terms'
-                        if any(term in name.lower() for term in ['terms', 'conditions', 'agree', 'accept']):
-                            field_type = 'terms'
-                    elif tag_name == 'select':
-                        field_type = 'select'
-                        # Try to determine more specific type from label
-                        field_identifier = f"{name} {placeholder} {label_text}".lower()
-                        specific_type = self.cv_detector._classify_field_type(field_identifier)
-                        if specific_type != 'unknown':
-                            field_type = specific_type
-                    else:
-                        # Use name, placeholder, or label to determine field type
-                        field_identifier = f"{name} {placeholder} {label_text}".lower()
-                        field_type = self.cv_detector._classify_field_type(field_identifier)
-                    
-                    form_fields.append({
-                        'x': int(box['x']),
-                        'y': int(box['y']),
-                        'width': int(box['width']),
-                        'height': int(box['height']),
-                        'center_x': int(box['x'] + box['width'] / 2),
-                        'center_y': int(box['y'] + box['height'] / 2),
-                        'name': name,
-                        'placeholder': placeholder,
-                        'label': label_text,
-                        'type': field_type,
-                        'input_type': input_type,
-                        'tag_name': tag_name,
-                        'element': input_elem
-                    })
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing input element: {e}")
-                    continue
+            for record in records:
+                name = record['name']
+                placeholder = record['placeholder']
+                input_type = record['input_type']
+                tag_name = record['tag_name']
+                label_text = record['label']
+                
+                # Determine field type
+                if input_type == 'checkbox':
+                    field_type = 'checkbox'
+                    if any(term in label_text.lower() for term in ['terms', 'conditions', 'agree', 'accept']):
+                        field_type = 'terms'
+                    if any(term in name.lower() for term in ['terms', 'conditions', 'agree', 'accept']):
+                        field_type = 'terms'
+                elif tag_name == 'select':
+                    field_type = 'select'
+                    # Try to determine more specific type from label
+                    field_identifier = f"{name} {placeholder} {label_text}".lower()
+                    specific_type = _classify_field_type(field_identifier)
+                    if specific_type != 'unknown':
+                        field_type = specific_type
+                else:
+                    # Use name, placeholder, or label to determine field type
+                    field_identifier = f"{name} {placeholder} {label_text}".lower()
+                    field_type = _classify_field_type(field_identifier)
+                
+                form_fields.append({
+                    'x': int(record['x']),
+                    'y': int(record['y']),
+                    'width': int(record['width']),
+                    'height': int(record['height']),
+                    'center_x': int(record['x'] + record['width'] / 2),
+                    'center_y': int(record['y'] + record['height'] / 2),
+                    'name': name,
+                    'placeholder': placeholder,
+                    'label': label_text,
+                    'type': field_type,
+                    'input_type': input_type,
+                    'tag_name': tag_name,
+                    'field_id': record['id'],
+                    # Locators are lazy, so no round-trip until the field is filled
+                    'element': page.locator(f'[{FIELD_ID_ATTR}="{record["id"]}"]')
+                })
             
             return form_fields
             
@@ -413,20 +773,54 @@ class CompetitionAutoEntry:
     async def _fill_form_fields(self, page: Page, form_fields: List[Dict]) -> int:
         """Fill form fields with personal information"""
         filled_count = 0
+        batch = {}
+        pending = []
         
         for field in form_fields:
             field_type = field['type']
             
             if field_type in self.personal_info:
                 value = self.personal_info[field_type]
-                if await self._fill_field(page, field, value):
-                    filled_count += 1
+                if 'field_id' in field:
+                    batch[str(field['field_id'])] = self._batch_fill_entry(field, value)
+                pending.append((field, value))
             else:
                 logger.info(f"Skipping unknown field type: {field_type}")
         
+        # Apply all DOM fills in one round-trip; anything it could not set
+        # (custom widgets, controlled inputs) goes through _fill_field below
+        applied = {}
+        if batch:
+            try:
+                applied = await page.evaluate(BATCH_FILL_JS, {'attr': FIELD_ID_ATTR, 'fields': batch})
+            except Exception as e:
+                logger.warning(f"Batched fill failed, filling fields individually: {e}")
+        
+        for field, value in pending:
+            if applied.get(str(field.get('field_id'))):
+                logger.info(f"Filled field {field['type']} with value: {value}")
+                filled_count += 1
+            elif await self._fill_field(page, field, value):
+                filled_count += 1
+        
         logger.info(f"Filled {filled_count} out of {len(form_fields)} fields")
         return filled_count
     
+    def _batch_fill_entry(self, field: Dict, value: Any) -> Dict:
+        """Describe how BATCH_FILL_JS should set a detected field"""
+        # For terms checkbox fields, always check them
+        if field['type'] in ['terms', 'terms_checkbox']:
+            value = True
+        
+        if field.get('input_type', '').lower() == 'checkbox':
+            checked = value if isinstance(value, bool) else str(value).lower() in ['true', 'yes', '1']
+            return {'kind': 'checkbox', 'value': checked}
+        if field.get('tag_name', '').lower() == 'select':
+            if isinstance(value, (list, tuple)) and len(value) > 0:
+                value = value[0]
+            return {'kind': 'select', 'value': str(value)}
+        return {'kind': 'text', 'value': str(value)}
+    
     async def _fill_field(self, page: Page, field: Dict, value: Any) -> bool:
         """Fill a single form field"""
         try:
@@ -490,40 +884,28 @@ class CompetitionAutoEntry:
     
     async def _submit_form(self, page: Page) -> bool:
         """Find and click the submit button"""
-        submit_selectors = [
-            'input[type="submit"]',
-            'button[type="submit"]',
-            'button:has-text("Submit")',
-            'button:has-text("Enter")',
-            'button:has-text("Send")',
-            'input[value="Submit"]',
-            'input[value="Enter"]',
-            '.submit-button',
-            '#submit',
-            'button.btn-primary',
-            'button.primary'
-        ]
-        
-        for selector in submit_selectors:
-            try:
-                submit_button = await page.query_selector(selector)
-                if submit_button:
-                    # Take screenshot before submitting
-                    await page.screenshot(path=f"screenshots/before_submit_{int(time.time())}.png")
-                    
-                    # Click the button
-                    await submit_button.click()
-                    logger.info(f"Clicked submit button: {selector}")
-                    
-                    # Wait for navigation or network idle
-                    try:
-                        await page.wait_for_load_state('networkidle', timeout=10000)
-                    except:
-                        pass
-                    
-                    return True
-            except Exception as e:
-                logger.warning(f"Error clicking submit button {selector}: {e}")
+        try:
+            submit_button = page.locator(SUBMIT_SELECTOR).first
+            if await submit_button.count() == 0:
+                # No CSS match, fall back to a button whose accessible name looks like submit
+                submit_button = page.get_by_role('button', name=SUBMIT_BUTTON_TEXT).first
+                if await submit_button.count() == 0:
+                    submit_button = None
+            
+            if submit_button:
+                # Take screenshot before submitting
+                await self._screenshot(page, f"screenshots/before_submit_{self._next_screenshot_id()}.jpg")
+                
+                # Click the button
+                await submit_button.click()
+                logger.info("Clicked submit button")
+                
+                # Wait briefly for navigation or network idle
+                await self._wait_until_ready(page)
+                
+                return True
+        except Exception as e:
+            logger.warning(f"Error clicking submit button: {e}")
         
         logger.warning("Could not find and click any submit button")
         return False
@@ -547,24 +929,22 @@ class CompetitionAutoEntry:
             # Wait a moment for any redirect or page change
             await asyncio.sleep(2)
             
-            # Get page content
-            content = await page.content()
-            content_lower = content.lower()
+            # Search the page text in the browser and get the URL in the same call
+            result = await page.evaluate(FIND_SUCCESS_INDICATOR_JS, success_indicators)
             
             # Check for success indicators in page content
-            for indicator in success_indicators:
-                if indicator in content_lower:
-                    logger.info(f"Found success indicator: {indicator}")
-                    return True
+            if result['indicator']:
+                logger.info(f"Found success indicator: {result['indicator']}")
+                return True
             
             # Check URL change (might indicate redirect to success page)
-            current_url = page.url
+            current_url = result['url']
             if any(word in current_url.lower() for word in ['success', 'thank', 'confirm']):
                 logger.info(f"Success URL detected: {current_url}")
                 return True
             
             # Take a screenshot of the possible failure
-            await page.screenshot(path=f"screenshots/verification_failed_{int(time.time())}.png")
+            await self._screenshot(page, f"screenshots/verification_failed_{self._next_screenshot_id()}.jpg")
             logger.warning("Could not verify submission success")
             return False
             
@@ -579,7 +959,83 @@ class ComputerVisionFormDetector:
     
     def __init__(self):
         self.screenshot_path = Path("screenshots")
-        self.screenshot_path.mkdir(exist_ok=True)
+        
+        # Structuring elements for isolating input borders, built once
+        self._horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (CV_MIN_HORIZONTAL_LINE, 1))
+        self._vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, CV_MIN_VERTICAL_LINE))
+        
+        # Tesseract handles are not thread-safe, so each OCR worker thread
+        # initialises its own once and reuses it for every region
+        self._tess_local = threading.local()
+        self._tess_failed = not TESSEROCR_AVAILABLE
+        # Every API created by a worker, so close() can release them
+        self._tess_apis = []
+        
+        # One long-lived pool, so its threads (and their Tesseract handles)
+        # survive from one screenshot to the next
+        self._ocr_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                thread_name_prefix='ocr')
+    
+    def close(self):
+        """Stop the OCR worker threads and release their Tesseract handles"""
+        self._ocr_executor.shutdown(wait=True)
+        for api in self._tess_apis:
+            api.End()
+        self._tess_apis.clear()
+    
+    def _get_tess_api(self):
+        """Return this thread's tesserocr API, or None to use pytesseract"""
+        if self._tess_failed:
+            return None
+        api = getattr(self._tess_local, 'api', None)
+        if api is None:
+            try:
+                api = PyTessBaseAPI(psm=PSM.SINGLE_LINE)
+            except Exception as e:
+                logger.warning(f"Failed to initialise tesserocr, falling back to pytesseract: {e}")
+                self._tess_failed = True
+                return None
+            self._tess_local.api = api
+            self._tess_apis.append(api)
+        return api
+    
+    def _ocr_region(self, region: np.ndarray) -> str:
+        """Extract text from a grayscale image region"""
+        api = self._get_tess_api()
+        if api is not None:
+            api.SetImage(Image.fromarray(region))
+            return api.GetUTF8Text().strip()
+        return pytesseract.image_to_string(region).strip()
+    
+    def _ocr_field(self, gray: np.ndarray, rect: Tuple[int, int, int, int]) -> str:
+        """OCR the label of a candidate field, returning an empty string on failure"""
+        x, y, w, h = rect
+        # The inside of an input is usually empty, so read the label above it,
+        # then the one to its left
+        crops = (
+            gray[max(0, y - LABEL_ABOVE_HEIGHT):y, x:x+w],
+            gray[y:y+h, max(0, x - LABEL_LEFT_WIDTH):x],
+        )
+        try:
+            for crop in crops:
+                # Skip blank crops without paying for an OCR call
+                if crop.size == 0 or np.var(crop) < OCR_MIN_VARIANCE:
+                    continue
+                text = self._ocr_region(crop)
+                if text:
+                    return text
+        except Exception as e:
+            logger.warning(f"OCR failed for field at ({x}, {y}): {e}")
+        return ""
+    
+    def _ocr_fields(self, gray: np.ndarray, rects: List[Tuple[int, int, int, int]]) -> List[str]:
+        """OCR candidate fields, spreading them over a thread pool when there are several"""
+        if len(rects) < OCR_PARALLEL_MIN_REGIONS:
+            return [self._ocr_field(gray, rect) for rect in rects]
+        
+        # Tesseract releases the GIL (and pytesseract waits on a subprocess),
+        # so threads give real parallelism without pickling image regions
+        return list(self._ocr_executor.map(lambda rect: self._ocr_field(gray, rect), rects))
     
     def take_screenshot(self, filename: str) -> str:
         """Take a screenshot of the current screen"""
@@ -596,93 +1052,58 @@ class ComputerVisionFormDetector:
         """Detect form fields in an image using computer vision"""
         logger.info(f"Analyzing image for form fields: {image_path}")
         
-        # Load the image
-        image = cv2.imread(image_path)
-        if image is None:
+        # Load the image straight into grayscale; colour is never used
+        gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if gray is None:
             logger.error(f"Failed to load image: {image_path}")
             return []
         
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # Edge detection is memory-bound, so run it on a half-size copy of
+        # large screenshots and scale the results back up afterwards
+        scale = CV_DOWNSAMPLE_FACTOR if max(gray.shape[:2]) > CV_DOWNSAMPLE_MIN_SIZE else 1
+        if scale > 1:
+            small = cv2.resize(gray, None, fx=1 / scale, fy=1 / scale, interpolation=cv2.INTER_AREA)
+        else:
+            small = gray
+        
+        # Binarise, then keep only long horizontal and vertical strokes so
+        # input borders survive while text glyphs are opened away
+        thresh = cv2.adaptiveThreshold(
+            small, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 15, 4
+        )
+        horizontal = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, self._horizontal_kernel)
+        vertical = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, self._vertical_kernel)
+        borders = cv2.bitwise_or(horizontal, vertical)
+        contours, _ = cv2.findContours(borders, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        
+        # Filter out very small or very large rectangles (in full-size pixels)
+        boxes = np.array([cv2.boundingRect(c) for c in contours], dtype=np.int32).reshape(-1, 4) * scale
+        widths, heights = boxes[:, 2], boxes[:, 3]
+        mask = (widths > 50) & (heights > 15) & (widths < 1000) & (heights < 200)
+        rects = [tuple(box) for box in boxes[mask].tolist()]
         
-        # Detect form fields using edge detection and contour finding
-        edges = cv2.Canny(gray, 50, 150)
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # OCR reads the full-resolution image so text stays legible
+        labels = self._ocr_fields(gray, rects)
         
         form_fields = []
-        for contour in contours:
-            x, y, w, h = cv2.boundingRect(contour)
+        for (x, y, w, h), label_text in zip(rects, labels):
+            # Classify the field type
+            field_type = _classify_field_type(label_text)
             
-            # Filter out very small or very large rectangles
-            if w > 50 and h > 15 and w < 1000 and h < 200:
-                # Extract the potential field region
-                field_region = gray[y:y+h, x:x+w]
-                
-                # Try to extract text using OCR
-                try:
-                    label_text = pytesseract.image_to_string(field_region).strip()
-                except Exception as e:
-                    logger.warning(f"OCR failed for field at ({x}, {y}): {e}")
-                    label_text = ""
-                
-                # Classify the field type
-                field_type = self._classify_field_type(label_text)
-                
-                form_fields.append({
-                    'x': x,
-                    'y': y,
-                    'width': w,
-                    'height': h,
-                    'center_x': x + w // 2,
-                    'center_y': y + h // 2,
-                    'label': label_text,
-                    'type': field_type
-                })
-                
-                logger.info(f"Detected field: {form_fields[-1]}")
+            form_fields.append({
+                'x': x,
+                'y': y,
+                'width': w,
+                'height': h,
+                'center_x': x + w // 2,
+                'center_y': y + h // 2,
+                'label': label_text,
+                'type': field_type
+            })
+            
+            logger.info(f"Detected field: {form_fields[-1]}")
         
         return form_fields
-    
-    def _classify_field_type(self, label_text: str) -> str:
-        """Classify the type of form field based on label text"""
-        label_lower = label_text.lower()
-        
-        # Email field detection
-        if any(keyword in label_lower for keyword in ['email', 'e-mail', 'mail']):
-            return 'email'
-        # Name field detection
-        elif any(keyword in label_lower for keyword in ['first', 'given', 'fname', 'firstname']):
-            return 'first_name'
-        elif any(keyword in label_lower for keyword in ['last', 'surname', 'family', 'lname', 'lastname']):
-            return 'last_name'
-        elif any(keyword in label_lower for keyword in ['name']) and not any(word in label_lower for word in ['first', 'last', 'user']):
-            return 'first_name'  # Assume general "name" field is first name
-        # Contact info
-        elif any(keyword in label_lower for keyword in ['phone', 'mobile', 'tel', 'number']):
-            return 'phone'
-        # Address fields
-        elif any(keyword in label_lower for keyword in ['address', 'street']):
-            return 'address'
-        elif any(keyword in label_lower for keyword in ['city', 'town']):
-            return 'city'
-        elif any(keyword in label_lower for keyword in ['state', 'province']):
-            return 'state'
-        elif any(keyword in label_lower for keyword in ['zip', 'postal', 'postcode']):
-            return 'postal_code'
-        # Terms and checkboxes
-        elif any(keyword in label_lower for keyword in ['terms', 'conditions', 'agree', 'accept']):
-            return 'terms'
-        elif any(keyword in label_lower for keyword in ['marketing', 'newsletter', 'subscribe']):
-            return 'checkbox'
-        # Common form fields
-        elif any(keyword in label_lower for keyword in ['custname', 'customer', 'comments', 'message']):
-            # Try to guess based on context
-            if 'name' in label_lower:
-                return 'first_name'
-            else:
-                return 'comments'
-        else:
-            return 'unknown'
 
 async def main():
     """Main entry point for the application"""
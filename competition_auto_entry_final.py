@@ -4,32 +4,73 @@ Competition Auto-Entry System - Production Version with Improved Windows Support
 Combines DOM inspection and computer vision for robust competition entry
 """
 
+from __future__ import annotations
+
 import asyncio
+import hashlib
 import json
 import logging
 import time
 import os
+import platform
+import re
+import signal
 import sys
-import argparse
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from types import MappingProxyType, SimpleNamespace
+from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union, Any
 from dotenv import load_dotenv
 
-# Import optional computer vision libraries
-try:
-    import cv2
-    import numpy as np
-    from PIL import Image
-    import pytesseract
-    CV_AVAILABLE = True
+# Optional computer vision libraries. They are only needed by the CV fallback,
+# so they are imported on first use (see _lazy_import_cv) rather than at startup
+cv2 = np = Image = pytesseract = None
+PyTessBaseAPI = PSM = None
+TESSEROCR_AVAILABLE = False
+
+@lru_cache(maxsize=None)
+def _lazy_import_cv() -> bool:
+    """Import the computer vision libraries, returning whether they are available"""
+    global cv2, np, Image, pytesseract, PyTessBaseAPI, PSM, TESSEROCR_AVAILABLE
+    try:
+        import cv2
+        import numpy as np
+        from PIL import Image
+        import pytesseract
+    except ImportError:
+        return False
     # Configure Tesseract path for Windows
     if sys.platform == "win32":
         pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-except ImportError:
-    CV_AVAILABLE = False
+    
+    # Prefer in-process Tesseract bindings; pytesseract spawns a process per call
+    try:
+        from tesserocr import PyTessBaseAPI, PSM
+        TESSEROCR_AVAILABLE = True
+    except ImportError:
+        TESSEROCR_AVAILABLE = False
+    return True
 
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+# Playwright is imported when the browser starts (see initialize) so that
+# --help and argument errors return without paying for its import
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Browser, BrowserContext
+
+# Use the libuv-based event loop when installed; it is API-compatible with asyncio.
+# Under PyPy the stock loop is used, since uvloop's Cython extension is not
+# supported well there.
+UVLOOP_AVAILABLE = False
+if platform.python_implementation() != 'PyPy':
+    try:
+        import uvloop
+        UVLOOP_AVAILABLE = True
+    except ImportError:
+        pass
 
 # Fix Windows encoding issues
 if sys.platform == "win32":
@@ -42,6 +83,9 @@ if sys.platform == "win32":
     except Exception as e:
         print(f"Warning: Failed to set up Unicode output: {e}")
 
+# Load environment overrides from .env once at import
+load_dotenv()
+
 # Configure logging
 os.makedirs('logs', exist_ok=True)
 current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -55,61 +99,602 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default number of competitions entered at once
+DEFAULT_CONCURRENCY = 8
+
+# Minimum gap between starting two entries on the same domain (seconds)
+DOMAIN_STAGGER_SECONDS = 0.1
+
+# Environment variables that override personal info fields from the config
+PERSONAL_INFO_ENV_VARS = {
+    'FIRST_NAME': 'first_name',
+    'LAST_NAME': 'last_name',
+    'EMAIL': 'email',
+    'PHONE': 'phone',
+    'ADDRESS_LINE1': 'address',
+    'CITY': 'city',
+    'STATE': 'state',
+    'POSTAL_CODE': 'postal_code',
+    'COUNTRY': 'country'
+}
+
+# Personal info used when neither the config nor the environment provide any
+DEFAULT_PERSONAL_INFO = MappingProxyType({
+    'email': 'example@example.com',
+    'first_name': 'John',
+    'last_name': 'Doe',
+    'phone': '+61400000000',
+    'address': '123 Sample St',
+    'city': 'Sydney',
+    'state': 'NSW',
+    'postal_code': '2000',
+    'country': 'Australia',
+    'comments': 'Thank you for the opportunity to participate!'
+})
+
+@lru_cache(maxsize=4)
+def _read_config_file(config_path: str, mtime: float) -> Dict:
+    """Parse a config file; cached per path and modification time"""
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
+# Warm browser contexts kept for entries, and how many entries each serves
+# before it is replaced; overridable with POOL_SIZE / MAX_USES_PER_CONTEXT
+DEFAULT_POOL_SIZE = 4
+DEFAULT_MAX_USES_PER_CONTEXT = 10
+
+# How long to wait for a login outcome after submitting credentials (ms)
+LOGIN_WAIT_TIMEOUT = 30000
+
+# JPEG quality for diagnostic screenshots; CV screenshots stay lossless PNG
+SCREENSHOT_JPEG_QUALITY = 60
+
+# Append-only log holding one JSON confirmation record per entry
+CONFIRMATION_LOG_PATH = "confirmations/log.jsonl"
+
+# Login sessions saved per site, and how long a saved session is trusted
+SESSION_STATE_DIR = ".state"
+SESSION_STATE_MAX_AGE = 24 * 60 * 60
+
+# Requests aborted in pooled contexts when block_heavy is enabled: resource
+# types a form never needs, and hosts serving analytics or tracking scripts
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+ANALYTICS_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'facebook.net',
+    'hotjar.com',
+    'segment.io',
+    'mixpanel.com',
+    'clarity.ms',
+)
+
+# Form controls considered during DOM detection
+FORM_FIELD_SELECTOR = 'input[type="text"], input[type="email"], input[name], textarea, input[type="checkbox"], select'
+
+# Attribute used to tag detected fields so they can be located again for filling
+FIELD_ID_ATTR = 'data-auto-entry-id'
+
+# Collects attributes, bounding boxes and labels for all visible form fields in
+# one call. Labels come from a matching label[for] first, then from the first
+# label within 150px horizontally and 50px vertically of the field. Visible
+# labels are bucketed into a 150x50 grid so each lookup only inspects the
+# 3x3 neighbouring cells instead of every label on the page.
+DETECT_FORM_FIELDS_JS = """
+    (selector) => {
+        const CELL_W = 150, CELL_H = 50;
+        const grid = new Map();
+        Array.from(document.querySelectorAll('label')).forEach((label, order) => {
+            if (label.getClientRects().length === 0) {
+                return;
+            }
+            const rect = label.getBoundingClientRect();
+            const key = Math.floor(rect.x / CELL_W) + ',' + Math.floor(rect.y / CELL_H);
+            if (!grid.has(key)) {
+                grid.set(key, []);
+            }
+            grid.get(key).push({label, order, x: rect.x, y: rect.y});
+        });
+        const nearestLabel = (rect) => {
+            const cx = Math.floor(rect.x / CELL_W), cy = Math.floor(rect.y / CELL_H);
+            let best = null;
+            for (let dx = -1; dx <= 1; dx++) {
+                for (let dy = -1; dy <= 1; dy++) {
+                    for (const l of grid.get((cx + dx) + ',' + (cy + dy)) || []) {
+                        if (Math.abs(l.x - rect.x) < CELL_W && Math.abs(l.y - rect.y) < CELL_H &&
+                            (best === null || l.order < best.order)) {
+                            best = l;
+                        }
+                    }
+                }
+            }
+            return best;
+        };
+        const records = [];
+        document.querySelectorAll(selector).forEach((el, idx) => {
+            if (el.getClientRects().length === 0) {
+                return;
+            }
+            const rect = el.getBoundingClientRect();
+            let labelText = '';
+            if (el.id) {
+                const label = document.querySelector(`label[for="${CSS.escape(el.id)}"]`);
+                if (label) {
+                    labelText = label.innerText;
+                }
+            }
+            if (!labelText) {
+                const nearby = nearestLabel(rect);
+                if (nearby) {
+                    labelText = nearby.label.innerText;
+                }
+            }
+            el.setAttribute('""" + FIELD_ID_ATTR + """', String(idx));
+            records.push({
+                id: idx,
+                name: el.getAttribute('name') || '',
+                placeholder: el.getAttribute('placeholder') || '',
+                input_type: el.getAttribute('type') || 'text',
+                tag_name: el.tagName.toLowerCase(),
+                label: labelText || '',
+                x: rect.x,
+                y: rect.y,
+                width: rect.width,
+                height: rect.height
+            });
+        });
+        return records;
+    }
+"""
+
+# Ordered keyword rules for classifying DOM text fields; the first rule with
+# a keyword anywhere in the field's name/placeholder/label wins
+DOM_FIELD_TYPE_RULES = (
+    ('email', ('email', 'e-mail')),
+    ('first_name', ('first', 'given', 'fname')),
+    ('last_name', ('last', 'surname', 'lname')),
+    # Assume a generic name field is a first name
+    ('first_name', ('name',)),
+    ('phone', ('phone', 'mobile', 'tel')),
+    ('address', ('address', 'street')),
+    ('city', ('city', 'town')),
+    ('postal_code', ('zip', 'postal', 'postcode')),
+    ('country', ('country',)),
+    ('comments', ('comment', 'message')),
+)
+
+# All rule keywords compiled into one pattern. The lookahead reports a match at
+# every position, and alternatives are listed in rule order so the
+# highest-priority keyword starting at a position is the one reported.
+_DOM_FIELD_KEYWORD_RULE = {
+    keyword: index
+    for index, (_, keywords) in reversed(list(enumerate(DOM_FIELD_TYPE_RULES)))
+    for keyword in keywords
+}
+_DOM_FIELD_KEYWORD_PATTERN = re.compile(
+    '(?=(' + '|'.join(
+        re.escape(keyword) for _, keywords in DOM_FIELD_TYPE_RULES for keyword in keywords
+    ) + '))'
+)
+
+# Ordered keyword rules for classifying CV-detected fields from their OCR
+# label; the first matching rule wins, with the 'name' and 'comments' rules
+# refined in _classify_cv_field
+CV_FIELD_TYPE_RULES = (
+    ('email', ('email', 'e-mail', 'mail')),
+    ('first_name', ('first', 'given', 'fname', 'firstname')),
+    ('last_name', ('last', 'surname', 'family', 'lname', 'lastname')),
+    ('name', ('name',)),
+    ('phone', ('phone', 'mobile', 'tel', 'number')),
+    ('address', ('address', 'street')),
+    ('city', ('city', 'town')),
+    ('state', ('state', 'province')),
+    ('postal_code', ('zip', 'postal', 'postcode')),
+    ('terms', ('terms', 'conditions', 'agree', 'accept')),
+    ('checkbox', ('marketing', 'newsletter', 'subscribe')),
+    ('comments', ('custname', 'customer', 'comments', 'message')),
+)
+_CV_FIELD_KEYWORD_RULE = {
+    keyword: index
+    for index, (_, keywords) in reversed(list(enumerate(CV_FIELD_TYPE_RULES)))
+    for keyword in keywords
+}
+_CV_FIELD_KEYWORD_PATTERN = re.compile(
+    '(?=(' + '|'.join(
+        re.escape(keyword) for _, keywords in CV_FIELD_TYPE_RULES for keyword in keywords
+    ) + '))'
+)
+
+@lru_cache(maxsize=2048)
+def _classify_cv_field(label_text: str) -> str:
+    """Classify a CV-detected field from its OCR label text"""
+    label_lower = label_text.lower()
+    
+    # Scan the label once and visit the matched rules in priority order
+    matched_rules = sorted({
+        _CV_FIELD_KEYWORD_RULE[match.group(1)]
+        for match in _CV_FIELD_KEYWORD_PATTERN.finditer(label_lower)
+    })
+    
+    for rule_index in matched_rules:
+        field_type = CV_FIELD_TYPE_RULES[rule_index][0]
+        if field_type == 'name':
+            # Assume general "name" field is first name
+            if 'user' in label_lower:
+                continue
+            return 'first_name'
+        if field_type == 'comments' and 'name' in label_lower:
+            # "custname"/"customer name" style fields
+            return 'first_name'
+        return field_type
+    
+    return 'unknown'
+
+# Keywords marking a checkbox as terms acceptance, and a select as a state picker
+TERMS_KEYWORD_RE = re.compile('terms|conditions|agree|accept')
+STATE_KEYWORD_RE = re.compile('state|province')
+
+def _classify_dom_field(field_identifier: str) -> str:
+    """Classify a DOM text field from its lowercased name/placeholder/label"""
+    rule_index = min(
+        (_DOM_FIELD_KEYWORD_RULE[match.group(1)]
+         for match in _DOM_FIELD_KEYWORD_PATTERN.finditer(field_identifier)),
+        default=None
+    )
+    if rule_index is None:
+        return 'unknown'
+    return DOM_FIELD_TYPE_RULES[rule_index][0]
+
+# Phrases on a page that indicate an entry went through
+SUCCESS_INDICATORS = (
+    'thank you',
+    'thanks for entering',
+    'entry received',
+    'entry confirmed',
+    'entry successful',
+    'thank you for your entry',
+    'success',
+    'confirmation',
+    'completed',
+    'congratulations',
+    'your entry has been submitted',
+    'entered successfully',
+    'your competition entry',
+    'subscribed',
+    'we have received your',
+    'confirmed',
+    'done',
+    'complete',
+)
+
+# Words in a post-submit URL that suggest a redirect to a success page
+SUCCESS_URL_KEYWORDS = ('success', 'thank', 'confirm')
+
+# Elements that visually confirm an entry, matched together in a single query
+CONFIRMATION_SELECTORS = (
+    '.success',
+    '.thank-you',
+    '.confirmation',
+    '.completed',
+    '.message',
+    '.check-mark',
+    '.check-icon',
+    '.success-icon',
+    '.success-message',
+    '#success-message',
+    '.alert-success',
+)
+CONFIRMATION_SELECTOR_GROUP = ', '.join(CONFIRMATION_SELECTORS)
+CONFIRMATION_ELEMENT_UNION = ', '.join(f'{selector}:visible' for selector in CONFIRMATION_SELECTORS)
+
+# Elements whose text is logged once a success indicator has been found
+SUCCESS_MESSAGE_SELECTOR = 'h1, h2, h3, h4, .success, .confirmation, .thank-you, .message'
+
+# How long to wait for a submission to show a result (ms). The check runs on
+# each DOM mutation rather than on a timer, and resolves once the URL changes
+# or a confirmation element appears.
+SUBMIT_SETTLE_TIMEOUT = 5000
+SUBMIT_SETTLED_JS = """
+    ({url, selector}) => location.href !== url || document.querySelector(selector) !== null
+"""
+
+# Plain CSS submit candidates, matched together in a single query
+SUBMIT_CSS_SELECTORS = (
+    'input[type="submit"]',
+    'button[type="submit"]',
+    'input[value="Submit"]',
+    'input[value="Enter"]',
+    '.submit-button',
+    '#submit',
+    'button.btn-primary',
+    'button.primary',
+    'button.enter-button',
+    'a.submit-button',
+    'a.enter-button',
+    'form .button',
+    'form button[type]',
+)
+# Button texts tried in order if no CSS candidate is visible
+SUBMIT_BUTTON_TEXTS = ('Submit', 'Enter', 'Send', 'Join', 'Register', 'Sign Up', 'Continue', 'Next', 'Apply')
+
+# Last-chance candidates: any button-like element whose text contains a keyword
+SUBMIT_FALLBACK_SELECTOR = 'button, input[type="button"], input[type="submit"], a.button, .btn'
+SUBMIT_FALLBACK_KEYWORDS = ('submit', 'enter', 'join', 'register', 'sign up', 'continue', 'next', 'apply')
+
+# Submits the form with the most email/name inputs (the first such form on a
+# tie, so a page with a single form behaves as before) and returns whether
+# there was a form to submit. Search boxes and unrelated forms score lowest.
+SUBMIT_BEST_FORM_JS = """
+    () => {
+        const score = form => form.querySelectorAll('input[type="email" i], input[name*="name" i], input[name*="mail" i]').length;
+        let best = null, bestScore = -1;
+        for (const form of document.forms) {
+            const formScore = score(form);
+            if (formScore > bestScore) {
+                best = form;
+                bestScore = formScore;
+            }
+        }
+        if (best) {
+            best.submit();
+        }
+        return best !== null;
+    }
+"""
+
+# Attribute marking the submit button chosen by FIND_SUBMIT_BUTTON_JS
+SUBMIT_ID_ATTR = 'data-auto-entry-submit'
+
+# Picks the submit button in one round-trip: the first visible, enabled match
+# for any SUBMIT_CSS_SELECTORS in document order, otherwise the first button
+# containing each of SUBMIT_BUTTON_TEXTS in turn (case-insensitive, like
+# Playwright's :has-text), otherwise the first SUBMIT_FALLBACK_SELECTOR match
+# whose text contains any SUBMIT_FALLBACK_KEYWORDS. Tags the button with
+# SUBMIT_ID_ATTR and returns a description of how it was found, or null if
+# nothing matched.
+FIND_SUBMIT_BUTTON_JS = """
+    ({attr, selectors, texts, fallbackSelector, keywords}) => {
+        document.querySelectorAll(`[${attr}]`).forEach(el => el.removeAttribute(attr));
+        const usable = el => !el.disabled && el.getClientRects().length > 0 &&
+            getComputedStyle(el).visibility !== 'hidden';
+        const pick = (el, description) => {
+            el.setAttribute(attr, '');
+            return description;
+        };
+        const cssMatch = Array.from(document.querySelectorAll(selectors.join(', '))).find(usable);
+        if (cssMatch) {
+            return pick(cssMatch, 'first visible CSS submit candidate');
+        }
+        const buttons = Array.from(document.querySelectorAll('button')).filter(usable);
+        for (const text of texts) {
+            const needle = text.toLowerCase();
+            const match = buttons.find(b => b.textContent.replace(/\\s+/g, ' ').toLowerCase().includes(needle));
+            if (match) {
+                return pick(match, `button:has-text("${text}")`);
+            }
+        }
+        for (const el of document.querySelectorAll(fallbackSelector)) {
+            // Input buttons carry their label in value rather than text
+            const text = (el.innerText || el.value || '').toLowerCase().trim();
+            if (usable(el) && keywords.some(k => text.includes(k))) {
+                return pick(el, `fallback button with text: ${text}`);
+            }
+        }
+        return null;
+    }
+"""
+
+# Sets every field tagged by DETECT_FORM_FIELDS_JS in one round-trip. Each
+# action carries the field id, how to set it and the value; returns whether
+# each one took effect. Inputs that are not text-like (radio, submit, hidden,
+# image...) are never given a value and report false, leaving them to the
+# per-field fill.
+BATCH_FILL_JS = """
+    ({attr, actions}) => {
+        const textTypes = new Set(['text', 'email', 'tel', 'url', 'search', 'password', 'number',
+                                   'date', 'datetime-local', 'month', 'week', 'time']);
+        return actions.map(({id, kind, value}) => {
+            try {
+                const element = document.querySelector(`[${attr}="${id}"]`);
+                if (!element) {
+                    return false;
+                }
+                if (kind === 'checkbox') {
+                    if (element.checked !== value) {
+                        element.click();
+                    }
+                    return element.checked === value;
+                }
+                if (kind === 'select') {
+                    const options = Array.from(element.options);
+                    const match = options.find(o => o.value === value) ||
+                        options.find(o => o.text.trim() === value) ||
+                        options[0];
+                    if (!match) {
+                        return false;
+                    }
+                    element.value = match.value;
+                } else {
+                    if (element.tagName === 'INPUT' && !textTypes.has(element.type)) {
+                        return false;
+                    }
+                    // Use the prototype setter so framework-controlled inputs see the change
+                    const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value');
+                    if (descriptor && descriptor.set) {
+                        descriptor.set.call(element, value);
+                    } else {
+                        element.value = value;
+                    }
+                }
+                element.dispatchEvent(new Event('input', {bubbles: true}));
+                element.dispatchEvent(new Event('change', {bubbles: true}));
+                return kind === 'select' || element.value === value;
+            } catch (e) {
+                return false;
+            }
+        });
+    }
+"""
+
+# Detects, classifies and fills every DOM field in a single round-trip by
+# composing DETECT_FORM_FIELDS_JS and BATCH_FILL_JS. Classification mirrors
+# _detect_form_fields_with_dom using DOM_FIELD_TYPE_RULES and the keyword
+# patterns passed in; `values` maps each field type to its checkbox, select
+# and text value. Returns the detection records, each with its type and,
+# if a value was applied, whether it took effect.
+DETECT_AND_FILL_JS = """
+    ({selector, attr, rules, termsPattern, statePattern, values}) => {
+        const detect = """ + DETECT_FORM_FIELDS_JS + """;
+        const fill = """ + BATCH_FILL_JS + """;
+        const termsRe = new RegExp(termsPattern), stateRe = new RegExp(statePattern);
+        const records = detect(selector);
+        const actions = [];
+        const actionIndex = new Map();
+        for (const record of records) {
+            const identifier = `${record.name} ${record.placeholder} ${record.label}`.toLowerCase();
+            if (record.input_type === 'checkbox') {
+                record.type = termsRe.test(identifier) ? 'terms' : 'checkbox';
+            } else if (record.tag_name === 'select') {
+                record.type = stateRe.test(identifier) ? 'state' :
+                    identifier.includes('country') ? 'country' : 'select';
+            } else {
+                const rule = rules.find(([, keywords]) => keywords.some(k => identifier.includes(k)));
+                record.type = rule ? rule[0] : 'unknown';
+            }
+            const variants = values[record.type];
+            if (variants === undefined) {
+                continue;
+            }
+            const kind = record.input_type.toLowerCase() === 'checkbox' ? 'checkbox' :
+                record.tag_name === 'select' ? 'select' : 'text';
+            actionIndex.set(record, actions.length);
+            actions.push({id: String(record.id), kind, value: variants[kind]});
+        }
+        const applied = fill({attr, actions});
+        for (const [record, index] of actionIndex) {
+            record.filled = applied[index];
+        }
+        return records;
+    }
+"""
+
+@dataclass
+class FormField:
+    """
+    A form field detected via the DOM
+    
+    Stored with fixed slots instead of a per-field dict. Supports the dict
+    lookups (field['type'], field.get, 'element' in field) used for
+    CV-detected fields, so both kinds can be handled by the same code.
+    """
+    __slots__ = ('x', 'y', 'width', 'height', 'center_x', 'center_y', 'name', 'placeholder',
+                 'label', 'type', 'input_type', 'tag_name', 'field_id', 'element')
+    
+    x: int
+    y: int
+    width: int
+    height: int
+    center_x: int
+    center_y: int
+    name: str
+    placeholder: str
+    label: str
+    type: str
+    input_type: str
+    tag_name: str
+    field_id: int
+    element: Any
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__slots__ else default
+
 class CompetitionAutoEntry:
     """
     Main competition auto-entry system
     Handles competition discovery, form detection, and entry
     """
     
-    def __init__(self, config_path: str = "config/config.json", headless: bool = False):
+    def __init__(self, config_path: str = "config/config.json", headless: bool = False,
+                 batch_fill: bool = False, pool_size: Optional[int] = None,
+                 max_uses_per_context: Optional[int] = None, debug: bool = False,
+                 capture_screenshots: Optional[bool] = None, block_heavy: bool = True):
         self.config = self._load_config(config_path)
         self.headless = headless
-        self.cv_detector = ComputerVisionFormDetector() if CV_AVAILABLE else None
+        # Capture screenshots of steps that succeeded as well as failures
+        self.debug = debug
+        # Screenshots are diagnostic only, so headless runs skip them unless debugging
+        if capture_screenshots is None:
+            capture_screenshots = debug or not headless
+        self.capture_screenshots = capture_screenshots
+        # Screenshots still being captured, by page
+        self._pending_screenshots: Dict[Page, List[asyncio.Task]] = {}
+        # Fill all DOM-detected fields with one page.evaluate instead of one call per field
+        self.batch_fill = batch_fill
+        # Skip images, fonts, media and analytics on competition pages; disable
+        # when the CV fallback needs fully rendered pages
+        self.block_heavy = block_heavy
+        # Created on first use so the CV libraries are not imported at startup
+        self._cv_detector = None
         self.playwright = None
         self.browser = None
         self.context = None
         
         # Load personal info from config and .env
         self._load_personal_info()
+        
+        # Warm browser contexts reused across competition entries
+        # At least one, or the first _acquire_context would wait forever
+        self.pool_size = max(1, pool_size or int(os.getenv('POOL_SIZE', DEFAULT_POOL_SIZE)))
+        self.max_uses_per_context = max_uses_per_context or int(
+            os.getenv('MAX_USES_PER_CONTEXT', DEFAULT_MAX_USES_PER_CONTEXT))
+        self.context_pool: Optional[asyncio.Queue] = None
+        self._pooled_contexts: List[BrowserContext] = []
+        self._context_uses: Dict[BrowserContext, int] = {}
+        self._context_versions: Dict[BrowserContext, int] = {}
+        # Cookies/local storage captured after login, shared with pooled contexts
+        self._storage_state: Optional[Dict] = None
+        self._storage_version = 0
+        # Sites logged in to during this run; created with the lock in initialize()
+        self._authed_sites: set = set()
+        self._auth_lock: Optional[asyncio.Lock] = None
+        
+        # Counter appended to per-entry file names so concurrent entries
+        # finishing within the same second don't overwrite each other
+        self._file_counter = 0
+        
+        # Buffered handle on CONFIRMATION_LOG_PATH, opened by initialize()
+        self._confirmation_log = None
+    
+    @property
+    def cv_detector(self) -> Optional[ComputerVisionFormDetector]:
+        """The computer vision fallback detector, or None if the libraries are missing"""
+        if self._cv_detector is None and _lazy_import_cv():
+            self._cv_detector = ComputerVisionFormDetector()
+        return self._cv_detector
     
     def _load_personal_info(self):
         """Load personal information from config file and environment variables"""
-        # First load from config
-        self.personal_info = self.config.get('personal_info', {})
+        # First load from config (copied, since the parsed config is cached)
+        self.personal_info = dict(self.config.get('personal_info', {}))
         
         # Then load from environment variables (overriding config)
-        load_dotenv()
-        env_vars = {
-            'FIRST_NAME': 'first_name',
-            'LAST_NAME': 'last_name',
-            'EMAIL': 'email',
-            'PHONE': 'phone',
-            'ADDRESS_LINE1': 'address',
-            'CITY': 'city',
-            'STATE': 'state',
-            'POSTAL_CODE': 'postal_code',
-            'COUNTRY': 'country'
-        }
-        
-        for env_var, field_name in env_vars.items():
+        for env_var, field_name in PERSONAL_INFO_ENV_VARS.items():
             value = os.getenv(env_var)
             if value:
                 self.personal_info[field_name] = value
         
         # Default values for missing fields
         if not self.personal_info:
-            self.personal_info = {
-                'email': 'example@example.com',
-                'first_name': 'John',
-                'last_name': 'Doe',
-                'phone': '+61400000000',
-                'address': '123 Sample St',
-                'city': 'Sydney',
-                'state': 'NSW',
-                'postal_code': '2000',
-                'country': 'Australia',
-                'comments': 'Thank you for the opportunity to participate!'
-            }
+            self.personal_info = dict(DEFAULT_PERSONAL_INFO)
         
         # Common field aliases
         self.personal_info['address_line1'] = self.personal_info.get('address_line1', self.personal_info.get('address', '123 Sample St'))
@@ -123,25 +708,176 @@ class CompetitionAutoEntry:
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from JSON file"""
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            return config
+            return _read_config_file(config_path, os.path.getmtime(config_path))
         except Exception as e:
             logger.error(f"Failed to load config from {config_path}: {e}")
             return {}
     
     async def initialize(self):
         """Initialize Playwright browser"""
+        from playwright.async_api import async_playwright
+        
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(
             headless=self.headless,
             args=['--no-sandbox', '--disable-dev-shm-usage']
         )
         self.context = await self.browser.new_context()
-        logger.info("Browser initialized")
+        self._auth_lock = asyncio.Lock()
+        
+        # Output directories are created once here rather than before every write
+        for directory in ("screenshots", "confirmations"):
+            os.makedirs(directory, exist_ok=True)
+        if self._confirmation_log is None:
+            self._confirmation_log = open(CONFIRMATION_LOG_PATH, "a", buffering=65536, encoding="utf-8")
+        
+        self.context_pool = asyncio.Queue()
+        for _ in range(self.pool_size):
+            self.context_pool.put_nowait(await self._new_pooled_context())
+        logger.info(f"Browser initialized with {self.pool_size} warm contexts")
+    
+    async def _new_pooled_context(self) -> BrowserContext:
+        """Create a context for the entry pool carrying the current login state"""
+        context = await self.browser.new_context(storage_state=self._storage_state)
+        if self.block_heavy:
+            await context.route('**/*', self._route_heavy_request)
+        self._pooled_contexts.append(context)
+        self._context_uses[context] = 0
+        self._context_versions[context] = self._storage_version
+        return context
+    
+    @staticmethod
+    async def _route_heavy_request(route):
+        """Abort requests for BLOCKED_RESOURCE_TYPES and ANALYTICS_HOSTS, continue the rest"""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in ANALYTICS_HOSTS):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def _acquire_context(self) -> BrowserContext:
+        """Take a warm context from the pool, refreshing it if the login state changed"""
+        context = await self.context_pool.get()
+        if self._context_versions.get(context) != self._storage_version:
+            # Create the replacement before closing the stale context, so a
+            # failure here hands the slot back instead of shrinking the pool
+            try:
+                fresh = await self._new_pooled_context()
+            except Exception:
+                self.context_pool.put_nowait(context)
+                raise
+            await self._close_replaced_context(context)
+            context = fresh
+        return context
+    
+    async def _release_context(self, context: BrowserContext):
+        """Return a context to the pool, replacing it once it has served its quota"""
+        self._context_uses[context] = self._context_uses.get(context, 0) + 1
+        if self._context_uses[context] >= self.max_uses_per_context:
+            # If no replacement can be made, the worn context goes back in its
+            # slot and recycling is retried on its next release
+            try:
+                fresh = await self._new_pooled_context()
+            except Exception as e:
+                logger.warning(f"Failed to recycle browser context: {e}")
+            else:
+                await self._close_replaced_context(context)
+                context = fresh
+        self.context_pool.put_nowait(context)
+    
+    async def _close_replaced_context(self, context: BrowserContext):
+        """Discard a context whose pool slot already holds its replacement"""
+        try:
+            await self._discard_context(context)
+        except Exception as e:
+            logger.warning(f"Failed to close replaced browser context: {e}")
+    
+    async def _discard_context(self, context: BrowserContext):
+        """Close a pooled context and forget about it"""
+        self._context_uses.pop(context, None)
+        self._context_versions.pop(context, None)
+        if context in self._pooled_contexts:
+            self._pooled_contexts.remove(context)
+        await context.close()
+    
+    def _next_file_id(self) -> str:
+        """Return a unique timestamped suffix for a screenshot or confirmation file"""
+        self._file_counter += 1
+        return f"{int(time.time())}_{self._file_counter}"
+    
+    async def _screenshot(self, page: Page, path: str) -> Optional[str]:
+        """
+        Take a diagnostic screenshot if screenshots are enabled
+        
+        Paths ending in .jpg are captured as JPEG, anything else as PNG.
+        Returns the path written, or None when screenshots are disabled.
+        """
+        if not self.capture_screenshots:
+            return None
+        if path.endswith('.jpg'):
+            await page.screenshot(path=path, type='jpeg', quality=SCREENSHOT_JPEG_QUALITY)
+        else:
+            await page.screenshot(path=path)
+        return path
+    
+    def _screenshot_in_background(self, page: Page, path: str) -> Optional[str]:
+        """
+        Start a diagnostic screenshot without waiting for it to be encoded
+        
+        The capture is tracked per page; call _finish_screenshots before
+        closing the page. Returns the path that will be written, or None
+        when screenshots are disabled.
+        """
+        if not self.capture_screenshots:
+            return None
+        task = asyncio.create_task(self._screenshot(page, path))
+        self._pending_screenshots.setdefault(page, []).append(task)
+        return path
+    
+    async def _finish_screenshots(self, page: Optional[Page] = None):
+        """Wait for background screenshots of one page, or of every page if none is given"""
+        if page is None:
+            tasks = [task for page_tasks in self._pending_screenshots.values() for task in page_tasks]
+            self._pending_screenshots.clear()
+        else:
+            tasks = self._pending_screenshots.pop(page, [])
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.warning(f"Screenshot failed: {result}")
+    
+    async def warm_dns(self, urls: List[str]):
+        """
+        Resolve the hosts of the given URLs so the lookups are cached before
+        the browser needs them. Failures are ignored; the browser will report
+        unreachable hosts itself.
+        """
+        loop = asyncio.get_running_loop()
+        hosts = {urlparse(url).hostname for url in urls}
+        hosts.discard(None)
+        if not hosts:
+            return
+        
+        results = await asyncio.gather(
+            *(loop.getaddrinfo(host, 443) for host in hosts),
+            return_exceptions=True
+        )
+        for host, result in zip(hosts, results):
+            if isinstance(result, Exception):
+                logger.debug(f"DNS warm-up failed for {host}: {result}")
+    
+    def flush_confirmations(self):
+        """Write buffered confirmation records out to the log file"""
+        if self._confirmation_log:
+            self._confirmation_log.flush()
     
     async def close(self):
         """Close Playwright browser"""
+        await self._finish_screenshots()
+        if self._confirmation_log:
+            self._confirmation_log.close()
+            self._confirmation_log = None
+        for context in list(self._pooled_contexts):
+            await self._discard_context(context)
         if self.context:
             await self.context.close()
         if self.browser:
@@ -151,16 +887,75 @@ class CompetitionAutoEntry:
         logger.info("Browser closed")
     
     async def authenticate(self, site: str):
-        """Authenticate with a competition site"""
-        logger.info(f"Authenticating with {site}...")
+        """
+        Authenticate with a competition site
         
-        if site.lower() == "competitioncloud":
-            return await self._authenticate_competition_cloud()
-        elif site.lower() == "gleam":
-            return await self._authenticate_gleam()
-        else:
-            logger.warning(f"No authentication method available for {site}")
-            return False
+        Logs in at most once per site per run. A session saved by a previous
+        run within SESSION_STATE_MAX_AGE is reused instead of logging in again.
+        """
+        site = site.lower()
+        async with self._auth_lock:
+            if site in self._authed_sites:
+                return True
+            
+            saved_state = self._load_session_state(site)
+            if saved_state is not None:
+                logger.info(f"Reusing saved {site} session")
+                await self.context.add_cookies(saved_state.get('cookies', []))
+                # Take the login context's full state so sessions for other
+                # sites stay in the pool; the saved local storage is merged in
+                # since add_cookies cannot restore it
+                state = await self.context.storage_state()
+                known_origins = {origin['origin'] for origin in state.get('origins', [])}
+                state['origins'] = state.get('origins', []) + [
+                    origin for origin in saved_state.get('origins', []) if origin['origin'] not in known_origins
+                ]
+                self._use_storage_state(site, state)
+                return True
+            
+            logger.info(f"Authenticating with {site}...")
+            
+            if site == "competitioncloud":
+                success = await self._authenticate_competition_cloud()
+            elif site == "gleam":
+                success = await self._authenticate_gleam()
+            else:
+                logger.warning(f"No authentication method available for {site}")
+                return False
+            
+            if success:
+                state = await self.context.storage_state()
+                self._use_storage_state(site, state)
+                self._save_session_state(site, state)
+            return success
+    
+    def _use_storage_state(self, site: str, state: Dict):
+        """Record a logged-in session; pooled contexts pick it up the next time they are used"""
+        self._storage_state = state
+        self._storage_version += 1
+        self._authed_sites.add(site)
+    
+    def _load_session_state(self, site: str) -> Optional[Dict]:
+        """Return the saved session for a site if it is recent enough to trust"""
+        path = os.path.join(SESSION_STATE_DIR, f"{site}.json")
+        try:
+            if time.time() - os.path.getmtime(path) > SESSION_STATE_MAX_AGE:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_session_state(self, site: str, state: Dict):
+        """Save a site's session so later runs can skip logging in"""
+        try:
+            os.makedirs(SESSION_STATE_DIR, exist_ok=True)
+            path = os.path.join(SESSION_STATE_DIR, f"{site}.json")
+            # The state holds session cookies, so keep it private to the user
+            with open(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        except OSError as e:
+            logger.warning(f"Could not save {site} session: {e}")
     
     async def _authenticate_competition_cloud(self):
         """Authenticate with CompetitionCloud"""
@@ -177,21 +972,22 @@ class CompetitionAutoEntry:
             try:
                 # Add longer timeout and progress indicator
                 logger.info("Waiting for login page to load (can take a minute)...")
-                await login_page.goto("https://www.competitioncloud.com.au/Account/Login", timeout=120000)
-                logger.info("Login page loaded, waiting for network to be idle...")
-                await login_page.wait_for_load_state('networkidle', timeout=60000)
+                await login_page.goto("https://www.competitioncloud.com.au/Account/Login", timeout=120000,
+                                      wait_until='domcontentloaded')
+                logger.info("Login page loaded, waiting for login form...")
+                await login_page.wait_for_selector('input[name="Email"], input[type="email"]', timeout=15000)
             except Exception as e:
                 logger.warning(f"Timeout while waiting for page to load fully: {e}")
                 logger.info("Attempting to continue anyway...")
                 
             # Take a screenshot of the login page
-            os.makedirs("screenshots", exist_ok=True)
-            await login_page.screenshot(path=f"screenshots/login_page_{int(time.time())}.png")
+            if self.debug:
+                await self._screenshot(login_page, f"screenshots/login_page_{int(time.time())}.jpg")
             
-            # Print the page content to help with debugging
-            page_content = await login_page.content()
-            logger.info(f"Page title: {await login_page.title()}")
-            logger.info(f"Current URL: {login_page.url}")
+            # Log where we ended up, reading title and URL in one call
+            title, current_url = await login_page.evaluate("() => [document.title, location.href]")
+            logger.info(f"Page title: {title}")
+            logger.info(f"Current URL: {current_url}")
             
             # Look for input fields with more relaxed selectors
             email_field = await login_page.query_selector('input[name="Email"], input[type="email"], input[id*="email" i]')
@@ -210,7 +1006,7 @@ class CompetitionAutoEntry:
                 
             # Enter credentials
             logger.info(f"Filling email field with: {email}")
-            await login_page.fill('input[name="Email"]', email)
+            await email_field.fill(email)
             
             logger.info("Filling password field")
             # Remove any quotes that might be in the password from the .env file
@@ -218,7 +1014,8 @@ class CompetitionAutoEntry:
             await login_page.fill('input[name="Password"]', clean_password)
             
             # Take screenshot before clicking login
-            await login_page.screenshot(path=f"screenshots/before_login_{int(time.time())}.png")
+            if self.debug:
+                await self._screenshot(login_page, f"screenshots/before_login_{int(time.time())}.jpg")
             logger.info("Clicking login button")
             
             # Click login button
@@ -226,48 +1023,53 @@ class CompetitionAutoEntry:
             
             # Wait for successful login indicators
             try:
-                await login_page.wait_for_load_state('networkidle', timeout=30000)
-                await login_page.screenshot(path=f"screenshots/after_login_click_{int(time.time())}.png")
+                await login_page.wait_for_load_state('domcontentloaded', timeout=30000)
+                if self.debug:
+                    await self._screenshot(login_page, f"screenshots/after_login_click_{int(time.time())}.jpg")
                 
-                for i in range(30):
-                    logger.info(f"Waiting for login completion (attempt {i+1}/30)")
-                    # Check for logout link
-                    logout_link = await login_page.query_selector('a:has-text("Logout")')
-                    if logout_link:
-                        logger.info("Found logout link - login successful")
-                        await login_page.screenshot(path=f"screenshots/login_success_{int(time.time())}.png")
-                        await login_page.close()
-                        return True
-                    
-                    # Check for user profile
-                    user_profile = await login_page.query_selector('.user-profile')
-                    if user_profile:
-                        logger.info("Found user profile - login successful")
-                        await login_page.screenshot(path=f"screenshots/login_success_{int(time.time())}.png")
-                        await login_page.close()
-                        return True
-                    
-                    # Check current URL to see if we're redirected to the dashboard
-                    current_url = login_page.url
-                    if "dashboard" in current_url.lower() or "account" in current_url.lower():
-                        logger.info(f"Redirected to {current_url} - login successful")
-                        await login_page.screenshot(path=f"screenshots/login_success_{int(time.time())}.png")
-                        await login_page.close()
-                        return True
-                    
-                    # Check for login error messages
-                    error_message = await login_page.query_selector('.validation-summary-errors')
-                    if error_message:
-                        error_text = await error_message.inner_text()
-                        logger.error(f"Login error: {error_text}")
-                        await login_page.screenshot(path=f"screenshots/login_error_{int(time.time())}.png")
-                        await login_page.close()
-                        return False
-                    
-                    await asyncio.sleep(1)
+                # Race the login outcome indicators; Playwright resolves each wait
+                # as soon as it matches instead of us polling every second
+                logger.info("Waiting for login completion...")
+                indicators = {
+                    'logout': asyncio.create_task(login_page.wait_for_selector('a:has-text("Logout")', timeout=LOGIN_WAIT_TIMEOUT)),
+                    'profile': asyncio.create_task(login_page.wait_for_selector('.user-profile', timeout=LOGIN_WAIT_TIMEOUT)),
+                    'redirect': asyncio.create_task(login_page.wait_for_url(
+                        lambda u: "dashboard" in u.lower() or "account" in u.lower(), timeout=LOGIN_WAIT_TIMEOUT)),
+                    'error': asyncio.create_task(login_page.wait_for_selector('.validation-summary-errors', timeout=LOGIN_WAIT_TIMEOUT)),
+                }
+                outcome = None
+                pending = set(indicators.values())
+                while pending and outcome is None:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for name, task in indicators.items():
+                        if task in done and task.exception() is None:
+                            outcome = name
+                            break
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                
+                if outcome == 'logout':
+                    logger.info("Found logout link - login successful")
+                elif outcome == 'profile':
+                    logger.info("Found user profile - login successful")
+                elif outcome == 'redirect':
+                    logger.info(f"Redirected to {login_page.url} - login successful")
+                elif outcome == 'error':
+                    error_text = await indicators['error'].result().inner_text()
+                    logger.error(f"Login error: {error_text}")
+                    await self._screenshot(login_page, f"screenshots/login_error_{int(time.time())}.jpg")
+                    await login_page.close()
+                    return False
+                
+                if outcome is not None:
+                    if self.debug:
+                        await self._screenshot(login_page, f"screenshots/login_success_{int(time.time())}.jpg")
+                    await login_page.close()
+                    return True
                 
                 logger.error("Authentication timeout - login indicators not found")
-                await login_page.screenshot(path=f"screenshots/login_failed_{int(time.time())}.png")
+                await self._screenshot(login_page, f"screenshots/login_failed_{int(time.time())}.jpg")
                 # Dump the page content for debugging
                 page_content = await login_page.content()
                 with open(f"screenshots/failed_login_page_{int(time.time())}.html", "w", encoding="utf-8") as f:
@@ -276,13 +1078,13 @@ class CompetitionAutoEntry:
                 return False
             except Exception as e:
                 logger.error(f"Error waiting for login completion: {e}")
-                await login_page.screenshot(path=f"screenshots/login_exception_{int(time.time())}.png")
+                await self._screenshot(login_page, f"screenshots/login_exception_{int(time.time())}.jpg")
                 await login_page.close()
                 return False
         except Exception as e:
             logger.error(f"Error during authentication: {e}")
             if 'login_page' in locals():
-                await login_page.screenshot(path=f"screenshots/auth_exception_{int(time.time())}.png")
+                await self._screenshot(login_page, f"screenshots/auth_exception_{int(time.time())}.jpg")
                 await login_page.close()
             return False
             
@@ -318,8 +1120,11 @@ class CompetitionAutoEntry:
                 if submit_button:
                     await submit_button.click()
                     
-                    # Wait for login to complete
-                    await login_page.wait_for_load_state('networkidle', timeout=10000)
+                    # Wait for login to complete; the user panel appears once logged in
+                    try:
+                        await login_page.wait_for_selector('.user-details', timeout=10000)
+                    except Exception:
+                        pass
                     
                     # Check if login was successful
                     if await login_page.query_selector('.user-details'):
@@ -354,25 +1159,30 @@ class CompetitionAutoEntry:
                 logger.error(f"Authentication with {site} failed, cannot continue")
                 return False
         
+        context = None
         try:
+            # Inside the try so a context that cannot be created fails only this entry
+            context = await self._acquire_context()
+            
             # Open competition page
-            page = await self.context.new_page()
+            page = await context.new_page()
             logger.info(f"Navigating to {url}")
             try:
                 await page.goto(url, timeout=60000, wait_until='domcontentloaded')
-                logger.info("Page loaded, waiting for network idle...")
-                await page.wait_for_load_state('networkidle', timeout=30000)
+                logger.info("Page loaded, waiting for form elements...")
+                await page.wait_for_selector('form, input, textarea', timeout=15000)
             except Exception as e:
                 logger.warning(f"Timeout while waiting for page to load fully: {e}")
                 logger.info("Attempting to continue anyway...")
             
-            # Take initial screenshot
-            timestamp = int(time.time())
-            os.makedirs("screenshots", exist_ok=True)
-            await page.screenshot(path=f"screenshots/competition_{timestamp}.png")
-            
-            # Detect form fields (DOM first, CV as fallback)
-            form_fields = await self._detect_form_fields(page)
+            # Take initial screenshot and detect form fields (DOM first, CV as
+            # fallback) concurrently; batch mode fills DOM fields in the same call
+            detect = self._detect_and_fill_form_fields(page) if self.batch_fill else self._detect_form_fields(page)
+            _, detected = await asyncio.gather(
+                self._screenshot(page, f"screenshots/competition_{self._next_file_id()}.jpg"),
+                detect,
+            )
+            form_fields, filled_count = detected if self.batch_fill else (detected, None)
             
             if not form_fields:
                 logger.warning("No form fields detected")
@@ -380,7 +1190,8 @@ class CompetitionAutoEntry:
                 return False
             
             # Fill form fields
-            filled_count = await self._fill_form_fields(page, form_fields)
+            if filled_count is None:
+                filled_count = await self._fill_form_fields(page, form_fields)
             
             if filled_count == 0:
                 logger.warning("No fields were filled")
@@ -400,10 +1211,10 @@ class CompetitionAutoEntry:
             
             # Take final screenshot
             timestamp = int(time.time())
-            os.makedirs("confirmations", exist_ok=True)
+            file_id = self._next_file_id()
             
-            screenshot_path = f"confirmations/{'success' if success else 'failure'}_{timestamp}.png"
-            await page.screenshot(path=screenshot_path)
+            screenshot_path = self._screenshot_in_background(
+                page, f"confirmations/{'success' if success else 'failure'}_{file_id}.jpg")
             
             # Save confirmation data
             confirmation_data = {
@@ -414,18 +1225,57 @@ class CompetitionAutoEntry:
                 "screenshot": screenshot_path
             }
             
-            confirmation_file = f"confirmations/{'success' if success else 'failure'}_{timestamp}.json"
-            with open(confirmation_file, "w", encoding="utf-8") as f:
-                json.dump(confirmation_data, f, indent=2)
+            self._confirmation_log.write(json.dumps(confirmation_data, separators=(',', ':')) + '\n')
             
+            await self._finish_screenshots(page)
             await page.close()
             return success
             
         except Exception as e:
             logger.error(f"Error entering competition: {e}")
             if 'page' in locals():
+                await self._finish_screenshots(page)
                 await page.close()
             return False
+        finally:
+            if context is not None:
+                await self._release_context(context)
+    
+    async def enter_competitions(self, urls: List[str], needs_auth: bool = False, site: str = None,
+                                 concurrency: int = DEFAULT_CONCURRENCY) -> List[bool]:
+        """
+        Enter several competitions concurrently, each in its own tab
+        
+        At most `concurrency` entries run at once, and entries on the same
+        domain are started at least DOMAIN_STAGGER_SECONDS apart.
+        Returns one success flag per URL, in order.
+        """
+        # Log in once up front rather than once per competition
+        if needs_auth and site:
+            if not await self.authenticate(site):
+                logger.error(f"Authentication with {site} failed, cannot continue")
+                return [False] * len(urls)
+            needs_auth = False
+        
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        loop = asyncio.get_running_loop()
+        next_start = {}
+        
+        async def enter_one(url: str) -> bool:
+            # Reserve a start slot for this domain, then wait for it
+            domain = urlparse(url).netloc
+            now = loop.time()
+            start = max(now, next_start.get(domain, now))
+            next_start[domain] = start + DOMAIN_STAGGER_SECONDS
+            if start > now:
+                await asyncio.sleep(start - now)
+            
+            async with semaphore:
+                return await self.enter_competition(url, needs_auth=needs_auth, site=site)
+        
+        results = list(await asyncio.gather(*(enter_one(url) for url in urls)))
+        self.flush_confirmations()
+        return results
     
     async def _detect_form_fields(self, page: Page) -> List[Dict]:
         """Detect form fields using DOM inspection and computer vision"""
@@ -436,13 +1286,19 @@ class CompetitionAutoEntry:
             logger.info(f"Detected {len(dom_fields)} form fields via DOM")
             return dom_fields
         
-        # Fallback to computer vision if available
-        if self.cv_detector and CV_AVAILABLE:
+        return await self._detect_form_fields_with_cv(page)
+    
+    async def _detect_form_fields_with_cv(self, page: Page) -> List[Dict]:
+        """Detect form fields from a screenshot, if computer vision is available"""
+        if self.cv_detector:
             logger.info("Falling back to computer vision for form detection")
-            screenshot_path = f"screenshots/form_detection_{int(time.time())}.png"
-            await page.screenshot(path=screenshot_path)
+            # Hand the PNG bytes straight to the detector instead of via a file
+            screenshot = await page.screenshot(type='png')
             
-            cv_fields = self.cv_detector.detect_form_fields(screenshot_path)
+            # Edge detection and OCR are CPU-bound, so run them on a worker
+            # thread to keep other concurrent entries responsive
+            cv_fields = await asyncio.get_running_loop().run_in_executor(
+                None, self.cv_detector.detect_form_fields, screenshot)
             logger.info(f"Detected {len(cv_fields)} form fields via computer vision")
             
             return cv_fields
@@ -450,109 +1306,45 @@ class CompetitionAutoEntry:
             logger.warning("Computer vision fallback not available")
             return []
     
-    async def _detect_form_fields_with_dom(self, page: Page) -> List[Dict]:
+    async def _detect_form_fields_with_dom(self, page: Page) -> List[FormField]:
         """Detect form fields using Playwright DOM inspection"""
         try:
             form_fields = []
             
-            # Find all input elements (text, email, checkboxes) and textareas
-            inputs = await page.query_selector_all('input[type="text"], input[type="email"], input[name], textarea, input[type="checkbox"], select')
+            # Read every field's attributes, position and label in a single round-trip
+            records = await page.evaluate(DETECT_FORM_FIELDS_JS, FORM_FIELD_SELECTOR)
             
-            for input_elem in inputs:
+            for record in records:
                 try:
-                    # Get element properties
-                    name = await input_elem.get_attribute('name') or ''
-                    placeholder = await input_elem.get_attribute('placeholder') or ''
-                    input_type = await input_elem.get_attribute('type') or 'text'
-                    tag_name = await input_elem.evaluate('el => el.tagName.toLowerCase()')
-                    
-                    # Get element position
-                    box = await input_elem.bounding_box()
-                    if not box:
-                        continue
-                    
-                    # Try to find associated label
-                    label_text = ''
-                    try:
-                        # Look for label by 'for' attribute
-                        input_id = await input_elem.get_attribute('id')
-                        if input_id:
-                            label = await page.query_selector(f'label[for="{input_id}"]')
-                            if label:
-                                label_text = await label.inner_text()
-                        
-                        # If no label found, look for nearby labels
-                        if not label_text:
-                            nearby_labels = await page.query_selector_all('label')
-                            for label in nearby_labels:
-                                label_box = await label.bounding_box()
-                                if label_box:
-                                    # Check if label is near the input
-                                    if (abs(label_box['x'] - box['x']) < 150 and 
-                                        abs(label_box['y'] - box['y']) < 50):
-                                        label_text = await label.inner_text()
-                                        break
-                    except Exception as e:
-                        logger.debug(f"Error finding label: {e}")
+                    name = record['name']
+                    placeholder = record['placeholder']
+                    input_type = record['input_type']
+                    tag_name = record['tag_name']
+                    label_text = record['label']
                     
                     # Determine field type
-                    field_type = 'unknown'
                     field_identifier = f"{name} {placeholder} {label_text}".lower()
                     
                     if input_type == 'checkbox':
-                        field_type = 'checkbox'
-                        if any(term in field_identifier for term in ['terms', 'conditions', 'agree', 'accept']):
-                            field_type = 'terms'
+                        field_type = 'terms' if TERMS_KEYWORD_RE.search(field_identifier) else 'checkbox'
                     elif tag_name == 'select':
-                        field_type = 'select'
                         # Try to determine more specific type from name/label
-                        if any(keyword in field_identifier for keyword in ['state', 'province']):
+                        if STATE_KEYWORD_RE.search(field_identifier):
                             field_type = 'state'
-                        elif any(keyword in field_identifier for keyword in ['country']):
+                        elif 'country' in field_identifier:
                             field_type = 'country'
+                        else:
+                            field_type = 'select'
                     else:
                         # Classify based on name/label
-                        if any(keyword in field_identifier for keyword in ['email', 'e-mail']):
-                            field_type = 'email'
-                        elif any(keyword in field_identifier for keyword in ['first', 'given', 'fname']):
-                            field_type = 'first_name'
-                        elif any(keyword in field_identifier for keyword in ['last', 'surname', 'lname']):
-                            field_type = 'last_name'
-                        elif 'name' in field_identifier and not any(word in field_identifier for word in ['first', 'last']):
-                            field_type = 'first_name'  # Assume generic name field is first name
-                        elif any(keyword in field_identifier for keyword in ['phone', 'mobile', 'tel']):
-                            field_type = 'phone'
-                        elif any(keyword in field_identifier for keyword in ['address', 'street']):
-                            field_type = 'address'
-                        elif any(keyword in field_identifier for keyword in ['city', 'town']):
-                            field_type = 'city'
-                        elif any(keyword in field_identifier for keyword in ['zip', 'postal', 'postcode']):
-                            field_type = 'postal_code'
-                        elif any(keyword in field_identifier for keyword in ['country']):
-                            field_type = 'country'
-                        elif any(keyword in field_identifier for keyword in ['comment', 'message']):
-                            field_type = 'comments'
+                        field_type = _classify_dom_field(field_identifier)
                     
-                    form_fields.append({
-                        'x': int(box['x']),
-                        'y': int(box['y']),
-                        'width': int(box['width']),
-                        'height': int(box['height']),
-                        'center_x': int(box['x'] + box['width'] / 2),
-                        'center_y': int(box['y'] + box['height'] / 2),
-                        'name': name,
-                        'placeholder': placeholder,
-                        'label': label_text,
-                        'type': field_type,
-                        'input_type': input_type,
-                        'tag_name': tag_name,
-                        'element': input_elem
-                    })
+                    form_fields.append(self._field_from_record(page, record, field_type))
                     
                     logger.info(f"Detected field: {field_type} (name: {name}, label: {label_text})")
                     
                 except Exception as e:
-                    logger.warning(f"Error processing input element: {e}")
+                    logger.warning(f"Error processing form field record: {e}")
                     continue
             
             return form_fields
@@ -561,8 +1353,84 @@ class CompetitionAutoEntry:
             logger.error(f"Error detecting form fields with DOM: {e}")
             return []
     
+    def _field_from_record(self, page: Page, record: Dict, field_type: str) -> FormField:
+        """Build a FormField from a DETECT_FORM_FIELDS_JS record"""
+        return FormField(
+            x=int(record['x']),
+            y=int(record['y']),
+            width=int(record['width']),
+            height=int(record['height']),
+            center_x=int(record['x'] + record['width'] / 2),
+            center_y=int(record['y'] + record['height'] / 2),
+            name=record['name'],
+            placeholder=record['placeholder'],
+            label=record['label'],
+            type=field_type,
+            input_type=record['input_type'],
+            tag_name=record['tag_name'],
+            field_id=record['id'],
+            # Locators are lazy, so no round-trip until the field is filled
+            element=page.locator(f'[{FIELD_ID_ATTR}="{record["id"]}"]')
+        )
+    
+    async def _detect_and_fill_form_fields(self, page: Page) -> Tuple[List[Dict], int]:
+        """
+        Detect, classify and fill DOM form fields with a single browser call
+        
+        Fields the script could not set (custom widgets) are retried through
+        _fill_field. If the DOM has no fields, the computer vision fallback is
+        detected and filled as usual.
+        
+        Returns:
+            The detected fields and the number of fields filled
+        """
+        values = {
+            field_type: self._fill_value_variants(field_type, value)
+            for field_type, value in self.personal_info.items()
+        }
+        try:
+            records = await page.evaluate(DETECT_AND_FILL_JS, {
+                'selector': FORM_FIELD_SELECTOR,
+                'attr': FIELD_ID_ATTR,
+                'rules': DOM_FIELD_TYPE_RULES,
+                'termsPattern': TERMS_KEYWORD_RE.pattern,
+                'statePattern': STATE_KEYWORD_RE.pattern,
+                'values': values,
+            })
+        except Exception as e:
+            logger.error(f"Error detecting and filling form fields with DOM: {e}")
+            records = []
+        
+        if not records:
+            form_fields = await self._detect_form_fields_with_cv(page)
+            if not form_fields:
+                return [], 0
+            return form_fields, await self._fill_form_fields(page, form_fields)
+        
+        logger.info(f"Detected {len(records)} form fields via DOM")
+        form_fields = []
+        filled_count = 0
+        for record in records:
+            field = self._field_from_record(page, record, record['type'])
+            form_fields.append(field)
+            field_type = field['type']
+            
+            if field_type not in self.personal_info:
+                logger.info(f"Skipping unknown field type: {field_type}")
+            elif record.get('filled'):
+                logger.info(f"Filled field {field_type} with value: {self.personal_info[field_type]}")
+                filled_count += 1
+            elif await self._fill_field(page, field, self.personal_info[field_type]):
+                filled_count += 1
+        
+        logger.info(f"Filled {filled_count} out of {len(form_fields)} fields")
+        return form_fields, filled_count
+    
     async def _fill_form_fields(self, page: Page, form_fields: List[Dict]) -> int:
         """Fill form fields with personal information"""
+        if self.batch_fill:
+            return await self._fill_form_fields_batched(page, form_fields)
+        
         filled_count = 0
         
         for field in form_fields:
@@ -578,6 +1446,68 @@ class CompetitionAutoEntry:
         logger.info(f"Filled {filled_count} out of {len(form_fields)} fields")
         return filled_count
     
+    async def _fill_form_fields_batched(self, page: Page, form_fields: List[Dict]) -> int:
+        """Fill form fields with personal information using a single browser call"""
+        filled_count = 0
+        actions = []
+        pending = []
+        
+        for field in form_fields:
+            field_type = field['type']
+            
+            if field_type in self.personal_info:
+                value = self.personal_info[field_type]
+                if 'field_id' in field:
+                    actions.append(self._batch_fill_action(field, value))
+                    pending.append((field, value, len(actions) - 1))
+                else:
+                    pending.append((field, value, None))
+            else:
+                logger.info(f"Skipping unknown field type: {field_type}")
+        
+        # Apply all DOM fills in one round-trip; anything it could not set
+        # (custom widgets, CV-detected fields) goes through _fill_field below
+        applied = []
+        if actions:
+            try:
+                applied = await page.evaluate(BATCH_FILL_JS, {'attr': FIELD_ID_ATTR, 'actions': actions})
+            except Exception as e:
+                logger.warning(f"Batched fill failed, filling fields individually: {e}")
+        
+        for field, value, index in pending:
+            if index is not None and index < len(applied) and applied[index]:
+                logger.info(f"Filled field {field['type']} with value: {value}")
+                filled_count += 1
+            elif await self._fill_field(page, field, value):
+                filled_count += 1
+        
+        logger.info(f"Filled {filled_count} out of {len(form_fields)} fields")
+        return filled_count
+    
+    def _batch_fill_action(self, field: FormField, value: Any) -> Dict:
+        """Describe how BATCH_FILL_JS should set a detected field"""
+        if field.input_type.lower() == 'checkbox':
+            kind = 'checkbox'
+        elif field.tag_name.lower() == 'select':
+            kind = 'select'
+        else:
+            kind = 'text'
+        value = self._fill_value_variants(field.type, value)[kind]
+        return {'id': str(field.field_id), 'kind': kind, 'value': value}
+    
+    def _fill_value_variants(self, field_type: str, value: Any) -> Dict[str, Any]:
+        """Return the value to apply to a field of this type as a checkbox, select or text input"""
+        # For terms checkbox fields, always check them
+        if field_type in ['terms', 'terms_checkbox']:
+            value = True
+        
+        option = value[0] if isinstance(value, (list, tuple)) and len(value) > 0 else value
+        return {
+            'checkbox': value if isinstance(value, bool) else str(value).lower() in ['true', 'yes', '1'],
+            'select': str(option),
+            'text': str(value),
+        }
+    
     async def _fill_field(self, page: Page, field: Dict, value: Any) -> bool:
         """Fill a single form field"""
         try:
@@ -641,101 +1571,40 @@ class CompetitionAutoEntry:
     
     async def _submit_form(self, page: Page) -> bool:
         """Find and click the submit button"""
-        submit_selectors = [
-            'input[type="submit"]',
-            'button[type="submit"]',
-            'button:has-text("Submit")',
-            'button:has-text("Enter")',
-            'button:has-text("Send")',
-            'button:has-text("Join")',
-            'button:has-text("Register")',
-            'button:has-text("Sign Up")',
-            'button:has-text("Continue")',
-            'button:has-text("Next")',
-            'button:has-text("Apply")',
-            'input[value="Submit"]',
-            'input[value="Enter"]',
-            '.submit-button',
-            '#submit',
-            'button.btn-primary',
-            'button.primary',
-            'button.enter-button',
-            'a.submit-button',
-            'a.enter-button',
-            'form .button',
-            'form button[type]'
-        ]
-        
         # Take screenshot before trying to submit
-        await page.screenshot(path=f"screenshots/before_submit_{int(time.time())}.png")
+        await self._screenshot(page, f"screenshots/before_submit_{self._next_file_id()}.jpg")
         
-        # Try each selector
-        for selector in submit_selectors:
-            try:
-                submit_button = await page.query_selector(selector)
-                if submit_button:
-                    # Check if button is visible and enabled
-                    is_visible = await submit_button.is_visible()
-                    if not is_visible:
-                        logger.info(f"Found submit button {selector} but it's not visible, skipping")
-                        continue
-                    
-                    # Click the button
-                    await submit_button.click()
-                    logger.info(f"Clicked submit button: {selector}")
-                    
-                    # Wait for navigation or network idle
-                    try:
-                        await page.wait_for_load_state('networkidle', timeout=10000)
-                    except:
-                        pass
-                    
-                    return True
-            except Exception as e:
-                logger.warning(f"Error clicking submit button {selector}: {e}")
-        
-        # Fallback: Try to find buttons by looking for promising candidates
+        # Choose among every CSS, text and fallback candidate in a single browser call
+        description = None
         try:
-            logger.info("Using fallback button detection method...")
-            buttons = await page.query_selector_all('button, input[type="button"], input[type="submit"], a.button, .btn')
-            for button in buttons:
-                try:
-                    button_text = await button.text_content() or ""
-                    button_text = button_text.lower().strip()
-                    
-                    # Check if this looks like a submit button
-                    if any(keyword in button_text for keyword in ['submit', 'enter', 'join', 'register', 'sign up', 'continue', 'next', 'apply']):
-                        logger.info(f"Found promising button with text: {button_text}")
-                        await button.click()
-                        
-                        # Wait for navigation or network idle
-                        try:
-                            await page.wait_for_load_state('networkidle', timeout=10000)
-                        except:
-                            pass
-                            
-                        return True
-                except Exception as e:
-                    logger.warning(f"Error checking/clicking button: {e}")
-                    continue
+            description = await page.evaluate(FIND_SUBMIT_BUTTON_JS, {
+                'attr': SUBMIT_ID_ATTR,
+                'selectors': SUBMIT_CSS_SELECTORS,
+                'texts': SUBMIT_BUTTON_TEXTS,
+                'fallbackSelector': SUBMIT_FALLBACK_SELECTOR,
+                'keywords': SUBMIT_FALLBACK_KEYWORDS,
+            })
         except Exception as e:
-            logger.warning(f"Error in fallback button detection: {e}")
+            logger.warning(f"Error looking for submit button: {e}")
         
-        # Last resort: Try to submit any form on the page
-        try:
-            forms = await page.query_selector_all('form')
-            if forms:
-                logger.info(f"Attempting to submit form directly")
-                await page.evaluate("""() => {
-                    document.querySelector('form').submit();
-                }""")
+        if description:
+            try:
+                # Click the button
+                start_url = page.url
+                await page.locator(f'[{SUBMIT_ID_ATTR}]').first.click()
+                logger.info(f"Clicked submit button: {description}")
                 
-                # Wait for navigation or network idle
-                try:
-                    await page.wait_for_load_state('networkidle', timeout=10000)
-                except:
-                    pass
-                    
+                await self._wait_for_submission(page, start_url)
+                return True
+            except Exception as e:
+                logger.warning(f"Error clicking submit button {description}: {e}")
+        
+        # Last resort: Try to submit the most entry-like form on the page
+        try:
+            start_url = page.url
+            if await page.evaluate(SUBMIT_BEST_FORM_JS):
+                logger.info(f"Submitted form directly")
+                await self._wait_for_submission(page, start_url)
                 return True
         except Exception as e:
             logger.warning(f"Error submitting form directly: {e}")
@@ -743,89 +1612,71 @@ class CompetitionAutoEntry:
         logger.warning("Could not find and click any submit button")
         return False
     
+    async def _wait_for_submission(self, page: Page, start_url: str):
+        """
+        Wait for a submitted form to navigate or show a confirmation element
+        
+        Replaces waiting for network idle, which pages with polling or
+        websocket traffic never reach.
+        """
+        try:
+            await page.wait_for_function(
+                SUBMIT_SETTLED_JS,
+                arg={'url': start_url, 'selector': CONFIRMATION_SELECTOR_GROUP},
+                polling='mutation',
+                timeout=SUBMIT_SETTLE_TIMEOUT
+            )
+        except Exception:
+            # A navigation tears down the page the check was running in
+            pass
+        try:
+            await page.wait_for_load_state('domcontentloaded', timeout=SUBMIT_SETTLE_TIMEOUT)
+        except Exception:
+            pass
+    
     async def _verify_submission_success(self, page: Page) -> bool:
         """Verify that the competition entry was successful"""
-        success_indicators = [
-            'thank you',
-            'thanks for entering',
-            'entry received',
-            'entry confirmed',
-            'entry successful',
-            'thank you for your entry',
-            'success',
-            'confirmation',
-            'completed',
-            'congratulations',
-            'your entry has been submitted',
-            'entered successfully',
-            'your competition entry',
-            'subscribed',
-            'we have received your',
-            'confirmed',
-            'done',
-            'complete'
-        ]
-        
         try:
             # Wait a moment for any redirect or page change
             await asyncio.sleep(2)
             
-            # Take a screenshot of the confirmation page
-            await page.screenshot(path=f"screenshots/confirmation_{int(time.time())}.png")
-            
-            # Get page content
-            content = await page.content()
-            content_lower = content.lower()
-            
-            # Get page title
-            title = await page.title()
-            
-            # Check for success indicators in page content
-            for indicator in success_indicators:
-                if indicator.lower() in content_lower or indicator.lower() in title.lower():
-                    logger.info(f"Found success indicator: {indicator}")
-                    
-                    # Capture more details to confirm success
-                    message_elements = await page.query_selector_all('h1, h2, h3, h4, .success, .confirmation, .thank-you, .message')
-                    for elem in message_elements:
-                        try:
-                            message = await elem.text_content()
-                            if message and len(message.strip()) > 0:
-                                logger.info(f"Success message found: {message.strip()}")
-                        except:
-                            pass
-                            
-                    return True
-            
-            # Check for visual confirmation elements
-            confirmation_selectors = [
-                '.success', 
-                '.thank-you', 
-                '.confirmation', 
-                '.completed',
-                '.message',
-                '.check-mark',
-                '.check-icon',
-                '.success-icon',
-                '.success-message',
-                '#success-message',
-                '.alert-success'
-            ]
-            
-            for selector in confirmation_selectors:
-                element = await page.query_selector(selector)
-                if element and await element.is_visible():
-                    logger.info(f"Found visual confirmation element: {selector}")
-                    return True
+            # Check the title and URL first; both are cheap compared with
+            # serialising the whole page
+            title_lower = (await page.title()).lower()
+            indicator = next((i for i in SUCCESS_INDICATORS if i in title_lower), None)
             
             # Check URL change (might indicate redirect to success page)
             current_url = page.url
-            if any(word in current_url.lower() for word in ['success', 'thank', 'confirm']):
+            current_url_lower = current_url.lower()
+            if indicator is None and any(word in current_url_lower for word in SUCCESS_URL_KEYWORDS):
                 logger.info(f"Success URL detected: {current_url}")
                 return True
             
+            # Check for success indicators in page content, lowercased once
+            if indicator is None:
+                content_lower = (await page.content()).lower()
+                indicator = next((i for i in SUCCESS_INDICATORS if i in content_lower), None)
+            if indicator is not None:
+                logger.info(f"Found success indicator: {indicator}")
+                
+                # Capture more details to confirm success
+                try:
+                    messages = await page.locator(SUCCESS_MESSAGE_SELECTOR).all_text_contents()
+                except:
+                    messages = []
+                for message in messages:
+                    if message and len(message.strip()) > 0:
+                        logger.info(f"Success message found: {message.strip()}")
+                        
+                return True
+            
+            # Check for visual confirmation elements with one query
+            if await page.locator(CONFIRMATION_ELEMENT_UNION).count() > 0:
+                logger.info("Found visual confirmation element")
+                return True
+            
             # Take a screenshot of the possible failure
-            await page.screenshot(path=f"screenshots/verification_failed_{int(time.time())}.png")
+            self._screenshot_in_background(page, f"screenshots/verification_failed_{self._next_file_id()}.jpg")
             logger.warning("No success indicators found in the page content")
             return False
             
@@ -833,6 +1684,18 @@ class CompetitionAutoEntry:
             logger.error(f"Error verifying submission success: {e}")
             return False
 
+# Number of OCR results kept by each ComputerVisionFormDetector
+OCR_CACHE_SIZE = 1024
+
+# Most candidate regions OCR'd per screenshot; the largest are kept
+CV_MAX_FIELDS = 50
+
+# Edge detection runs on the screenshot resized by this factor
+CV_EDGE_SCALE = 0.5
+
+# Words from a whole-page pytesseract pass below this confidence are ignored
+OCR_MIN_CONFIDENCE = 30
+
 class ComputerVisionFormDetector:
     """
     Computer vision-based form detection system
@@ -840,159 +1703,459 @@ class ComputerVisionFormDetector:
     """
     
     def __init__(self):
-        if not CV_AVAILABLE:
+        if not _lazy_import_cv():
             logger.warning("Computer vision libraries not available. CV-based form detection disabled.")
             return
             
         self.screenshot_path = Path("screenshots")
         self.screenshot_path.mkdir(exist_ok=True)
+        
+        # OCR results keyed by a hash of the region's pixels, least recently used first
+        self._ocr_cache: OrderedDict = OrderedDict()
+        # Detection runs on worker threads; guards the cache and the Tesseract
+        # instance, which can only read one image at a time
+        self._ocr_lock = threading.Lock()
+        
+        # One Tesseract instance for the detector's lifetime, so the model is
+        # loaded once rather than by a new tesseract process per region
+        self._tess_api = None
+        if TESSEROCR_AVAILABLE:
+            try:
+                self._tess_api = PyTessBaseAPI(psm=PSM.SPARSE_TEXT, lang='eng')
+                self._tess_api.SetVariable('tessedit_do_invert', '0')
+            except Exception as e:
+                logger.warning(f"Failed to initialise tesserocr, falling back to pytesseract: {e}")
     
-    def detect_form_fields(self, image_path: str) -> List[Dict]:
-        """Detect form fields in an image using computer vision"""
-        if not CV_AVAILABLE:
-            logger.warning("Computer vision libraries not available. Cannot detect form fields.")
-            return []
+    def _ocr_region(self, region: np.ndarray) -> str:
+        """Extract text from a grayscale region, reusing results for identical pixels"""
+        key = (region.shape, hashlib.blake2b(region.tobytes(), digest_size=16).digest())
+        with self._ocr_lock:
+            text = self._ocr_cache.get(key)
+            if text is not None:
+                self._ocr_cache.move_to_end(key)
+                return text
             
-        logger.info(f"Analyzing image for form fields: {image_path}")
+            if self._tess_api is not None:
+                self._tess_api.SetImage(Image.fromarray(region))
+                text = self._tess_api.GetUTF8Text().strip()
+        
+        if text is None:
+            # pytesseract runs a separate process per call, so it needs no lock
+            text = pytesseract.image_to_string(region).strip()
+        with self._ocr_lock:
+            self._ocr_cache[key] = text
+            if len(self._ocr_cache) > OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+        return text
+    
+    def _ocr_page_words(self, gray: np.ndarray) -> Tuple[np.ndarray, List[str]]:
+        """
+        OCR a whole grayscale image with one pytesseract call
+        
+        Returns the centre point of each confidently read word and the words
+        themselves, in Tesseract's reading order.
+        """
+        data = pytesseract.image_to_data(gray, output_type=pytesseract.Output.DICT)
+        texts = [text.strip() for text in data['text']]
+        conf = np.array(data['conf'], dtype=float)
+        keep = (conf >= OCR_MIN_CONFIDENCE) & np.array([bool(text) for text in texts], dtype=bool)
+        centers = np.column_stack((
+            np.array(data['left']) + np.array(data['width']) // 2,
+            np.array(data['top']) + np.array(data['height']) // 2,
+        ))[keep]
+        return centers, [text for text, kept in zip(texts, keep) if kept]
+    
+    def _load_grayscale(self, image: Union[str, bytes, np.ndarray]) -> Optional[np.ndarray]:
+        """Decode an image file path, encoded image bytes or BGR array to grayscale"""
+        if isinstance(image, str):
+            return cv2.imread(image, cv2.IMREAD_GRAYSCALE)
+        if isinstance(image, (bytes, bytearray)):
+            return cv2.imdecode(np.frombuffer(image, np.uint8), cv2.IMREAD_GRAYSCALE)
+        if image.ndim == 2:
+            return image
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    
+    def detect_form_fields(self, image: Union[str, bytes, np.ndarray]) -> List[Dict]:
+        """
+        Detect form fields in an image using computer vision
         
-        # Load the image
-        image = cv2.imread(image_path)
-        if image is None:
-            logger.error(f"Failed to load image: {image_path}")
+        The image can be a file path, encoded image bytes (e.g. a Playwright
+        screenshot buffer) or an already decoded array.
+        """
+        if not _lazy_import_cv():
+            logger.warning("Computer vision libraries not available. Cannot detect form fields.")
             return []
         
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        source = image if isinstance(image, str) else "in-memory screenshot"
+        logger.info(f"Analyzing image for form fields: {source}")
         
-        # Detect form fields using edge detection and contour finding
-        edges = cv2.Canny(gray, 50, 150)
+        # Load the image straight into grayscale; colour is never used
+        gray = self._load_grayscale(image)
+        if gray is None:
+            logger.error(f"Failed to load image: {source}")
+            return []
+        
+        # Detect form fields using edge detection and contour finding on a
+        # downscaled copy; field outlines survive the resize and OCR below
+        # still reads the full-resolution image
+        small = cv2.resize(gray, (0, 0), fx=CV_EDGE_SCALE, fy=CV_EDGE_SCALE, interpolation=cv2.INTER_AREA)
+        edges = cv2.Canny(small, 50, 150)
         contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
+        if not contours:
+            return []
+        
+        # Filter out very small or very large rectangles for all contours at once
+        rects = np.array([cv2.boundingRect(contour) for contour in contours], dtype=np.float64)
+        rects = (rects / CV_EDGE_SCALE).astype(np.int32)
+        widths, heights = rects[:, 2], rects[:, 3]
+        rects = rects[(widths > 50) & (heights > 15) & (widths < 1000) & (heights < 200)]
+        
+        # OCR is the expensive step, so only the largest candidates are read,
+        # kept in their original contour order
+        if len(rects) > CV_MAX_FIELDS:
+            largest = np.argsort(-(rects[:, 2] * rects[:, 3]), kind='stable')[:CV_MAX_FIELDS]
+            rects = rects[np.sort(largest)]
+        
+        # Without tesserocr each region would cost a tesseract process, so
+        # read the whole page once and assign words to the regions they fall in
+        page_words = None
+        if self._tess_api is None and len(rects) > 1:
+            try:
+                page_words = self._ocr_page_words(gray)
+            except Exception as e:
+                logger.warning(f"Whole-page OCR failed, reading regions individually: {e}")
+        
         form_fields = []
-        for contour in contours:
-            x, y, w, h = cv2.boundingRect(contour)
+        for x, y, w, h in rects.tolist():
+            # Try to extract text using OCR
+            try:
+                if page_words is not None:
+                    centers, words = page_words
+                    inside = ((centers[:, 0] >= x) & (centers[:, 0] < x + w) &
+                              (centers[:, 1] >= y) & (centers[:, 1] < y + h))
+                    label_text = ' '.join(words[i] for i in np.flatnonzero(inside))
+                else:
+                    # Extract the potential field region
+                    label_text = self._ocr_region(gray[y:y+h, x:x+w])
+            except Exception as e:
+                logger.warning(f"OCR failed for field at ({x}, {y}): {e}")
+                label_text = ""
             
-            # Filter out very small or very large rectangles
-            if w > 50 and h > 15 and w < 1000 and h < 200:
-                # Extract the potential field region
-                field_region = gray[y:y+h, x:x+w]
-                
-                # Try to extract text using OCR
-                try:
-                    label_text = pytesseract.image_to_string(field_region).strip()
-                except Exception as e:
-                    logger.warning(f"OCR failed for field at ({x}, {y}): {e}")
-                    label_text = ""
-                
-                # Classify the field type
-                field_type = self._classify_field_type(label_text)
-                
-                form_fields.append({
-                    'x': x,
-                    'y': y,
-                    'width': w,
-                    'height': h,
-                    'center_x': x + w // 2,
-                    'center_y': y + h // 2,
-                    'label': label_text,
-                    'type': field_type
-                })
-                
-                logger.info(f"Detected field via CV: {form_fields[-1]}")
+            # Classify the field type
+            field_type = self._classify_field_type(label_text)
+            
+            form_fields.append({
+                'x': x,
+                'y': y,
+                'width': w,
+                'height': h,
+                'center_x': x + w // 2,
+                'center_y': y + h // 2,
+                'label': label_text,
+                'type': field_type
+            })
+            
+            logger.info(f"Detected field via CV: {form_fields[-1]}")
         
         return form_fields
     
     def _classify_field_type(self, label_text: str) -> str:
         """Classify the type of form field based on label text"""
-        label_lower = label_text.lower()
-        
-        # Email field detection
-        if any(keyword in label_lower for keyword in ['email', 'e-mail', 'mail']):
-            return 'email'
-        # Name field detection
-        elif any(keyword in label_lower for keyword in ['first', 'given', 'fname', 'firstname']):
-            return 'first_name'
-        elif any(keyword in label_lower for keyword in ['last', 'surname', 'family', 'lname', 'lastname']):
-            return 'last_name'
-        elif any(keyword in label_lower for keyword in ['name']) and not any(word in label_lower for word in ['first', 'last', 'user']):
-            return 'first_name'  # Assume general "name" field is first name
-        # Contact info
-        elif any(keyword in label_lower for keyword in ['phone', 'mobile', 'tel', 'number']):
-            return 'phone'
-        # Address fields
-        elif any(keyword in label_lower for keyword in ['address', 'street']):
-            return 'address'
-        elif any(keyword in label_lower for keyword in ['city', 'town']):
-            return 'city'
-        elif any(keyword in label_lower for keyword in ['state', 'province']):
-            return 'state'
-        elif any(keyword in label_lower for keyword in ['zip', 'postal', 'postcode']):
-            return 'postal_code'
-        # Terms and checkboxes
-        elif any(keyword in label_lower for keyword in ['terms', 'conditions', 'agree', 'accept']):
-            return 'terms'
-        elif any(keyword in label_lower for keyword in ['marketing', 'newsletter', 'subscribe']):
-            return 'checkbox'
-        # Common form fields
-        elif any(keyword in label_lower for keyword in ['custname', 'customer', 'comments', 'message']):
-            # Try to guess based on context
-            if 'name' in label_lower:
-                return 'first_name'
-            else:
-                return 'comments'
+        return _classify_cv_field(label_text)
+
+# Command-line options understood by the fast argument path
+CLI_VALUE_OPTIONS = {
+    '--site': 'site', '--config': 'config', '--concurrency': 'concurrency', '--socket': 'socket',
+}
+CLI_FLAG_OPTIONS = {
+    '--auth': 'auth', '--headless': 'headless', '--test': 'test', '--batch': 'batch', '--daemon': 'daemon',
+}
+CLI_DEFAULTS = {
+    'url': None, 'site': None, 'config': 'config/config.json',
+    'auth': False, 'headless': False, 'test': False, 'batch': False,
+    'concurrency': DEFAULT_CONCURRENCY, 'daemon': False, 'socket': None,
+}
+
+# Per-entry result messages, formatted lazily by the logger
+MSG_ENTRY_SUCCESS = "✓ Competition entry successful! (%s)"
+MSG_ENTRY_FAILED = "✗ Competition entry failed (%s)"
+
+# Attempts at starting the browser before giving up on transient errors
+INIT_ATTEMPTS = 2
+
+# Unix socket a --daemon process listens on for competition URLs
+DEFAULT_DAEMON_SOCKET = 'competition_auto_entry.sock'
+
+def _parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the common invocations without building an ArgumentParser
+    
+    Returns None for anything unusual (--help, unknown or malformed
+    options) so the caller can fall back to argparse.
+    """
+    values = dict(CLI_DEFAULTS)
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        if token in CLI_FLAG_OPTIONS:
+            values[CLI_FLAG_OPTIONS[token]] = True
+        elif token == '--url':
+            # One or more URLs, up to the next option
+            urls = []
+            while i + 1 < len(argv) and not argv[i + 1].startswith('-'):
+                urls.append(argv[i + 1])
+                i += 1
+            if not urls:
+                return None
+            values['url'] = urls
+        elif token in CLI_VALUE_OPTIONS and i + 1 < len(argv) and not argv[i + 1].startswith('-'):
+            values[CLI_VALUE_OPTIONS[token]] = argv[i + 1]
+            i += 1
         else:
-            return 'unknown'
+            return None
+        i += 1
+    try:
+        values['concurrency'] = int(values['concurrency'])
+    except ValueError:
+        return None
+    return SimpleNamespace(**values)
 
-async def main():
-    """Main entry point for the application"""
+def _parse_args_full() -> Any:
+    """Parse arguments with argparse, handling --help and usage errors"""
+        
     parser = argparse.ArgumentParser(description='Competition Auto-Entry System')
-    parser.add_argument('--url', help='URL of the competition to enter')
+    parser.add_argument('--url', nargs='+', help='URL(s) of the competitions to enter')
     parser.add_argument('--auth', action='store_true', help='Authenticate before entering')
     parser.add_argument('--site', help='Site name for authentication (e.g., competitioncloud, gleam)')
     parser.add_argument('--headless', action='store_true', help='Run browser in headless mode')
     parser.add_argument('--test', action='store_true', help='Run in test mode with local form')
     parser.add_argument('--config', default='config/config.json', help='Path to config file')
+    parser.add_argument('--batch', action='store_true', help='Fill each form with a single browser call')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Maximum number of competitions to enter at once')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Keep the browser running and accept URLs over a Unix socket')
+    parser.add_argument('--socket', help=f'Daemon socket path (default: {DEFAULT_DAEMON_SOCKET})')
     
-    args = parser.parse_args()
+    return parser.parse_args()
+
+def _enable_eager_tasks():
+    """On Python 3.12+, run new tasks synchronously until their first suspension"""
+    # Many browser calls finish without ever yielding
+    if sys.version_info >= (3, 12):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+def _transient_errors() -> Tuple[type, ...]:
+    """Exception types worth retrying, including Playwright's own timeout"""
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    
+    return (TimeoutError, ConnectionError, PlaywrightTimeoutError)
+
+async def _initialize_with_retry(auto_entry: CompetitionAutoEntry, transient_errors: Tuple[type, ...]):
+    """Start the browser, retrying launch failures that are likely transient"""
+    for attempt in range(1, INIT_ATTEMPTS + 1):
+        try:
+            await auto_entry.initialize()
+            return
+        except transient_errors as e:
+            if attempt == INIT_ATTEMPTS:
+                raise
+            logger.warning("Browser start failed (attempt %d/%d): %s", attempt, INIT_ATTEMPTS, e)
+            # Release whatever was started before trying again on the same instance
+            await auto_entry.close()
+            auto_entry.playwright = auto_entry.browser = auto_entry.context = None
+            auto_entry.context_pool = None
+
+@lru_cache(maxsize=1)
+def _local_test_form_url() -> Optional[str]:
+    """Resolve the local test form once, returning its file:// URL if it exists"""
+    local_form_path = os.path.abspath("test_form.html")
+    if os.path.exists(local_form_path):
+        return f"file://{local_form_path}"
+    return None
+
+def _log_results(urls: List[str], results: List[bool]):
+    """Log the outcome of each competition entry"""
+    for url, success in zip(urls, results):
+        if success:
+            logger.info(MSG_ENTRY_SUCCESS, url)
+        else:
+            logger.warning(MSG_ENTRY_FAILED, url)
+    
+    if len(urls) > 1:
+        logger.info("Entered %d of %d competitions", sum(results), len(urls))
+
+async def _run_daemon(args: Any):
+    """
+    Keep one initialized CompetitionAutoEntry alive and serve entry requests
+    
+    Clients send newline-delimited JSON commands ({"url", "auth", "site"})
+    and get one {"url", "success"} line back per command as it completes.
+    """
+    if not hasattr(asyncio, 'start_unix_server'):
+        logger.error("Daemon mode needs Unix domain sockets, which this platform does not support")
+        return
+    
+    socket_path = args.socket or DEFAULT_DAEMON_SOCKET
+    auto_entry = CompetitionAutoEntry(config_path=args.config, headless=args.headless,
+                                      batch_fill=args.batch)
+    semaphore = asyncio.Semaphore(max(1, args.concurrency))
+    
+    async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        async def run(command: Dict):
+            async with semaphore:
+                success = await auto_entry.enter_competition(
+                    command['url'],
+                    needs_auth=bool(command.get('auth')),
+                    site=command.get('site')
+                )
+            writer.write((json.dumps({'url': command['url'], 'success': success}) + '\n').encode('utf-8'))
+        
+        tasks = []
+        try:
+            async for line in reader:
+                try:
+                    command = json.loads(line)
+                except ValueError:
+                    command = None
+                if not isinstance(command, dict) or 'url' not in command:
+                    logger.warning("Ignoring malformed daemon command: %r", line)
+                    continue
+                tasks.append(asyncio.create_task(run(command)))
+            await asyncio.gather(*tasks)
+            auto_entry.flush_confirmations()
+            await writer.drain()
+        except ConnectionError as e:
+            logger.warning("Daemon client disconnected: %s", e)
+        finally:
+            writer.close()
+    
+    transient_errors = _transient_errors()
+    
+    try:
+        _enable_eager_tasks()
+        await _initialize_with_retry(auto_entry, transient_errors)
+        
+        server = await asyncio.start_unix_server(handle_client, path=socket_path)
+        
+        # Shut down cleanly on SIGINT/SIGTERM so the browser is closed
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+        
+        logger.info("Daemon listening on %s", socket_path)
+        async with server:
+            await stop.wait()
+        logger.info("Daemon shutting down")
+    except transient_errors as e:
+        logger.error("Error: %s", e)
+    except Exception:
+        logger.exception("Fatal error")
+    finally:
+        await auto_entry.close()
+        try:
+            os.remove(socket_path)
+        except FileNotFoundError:
+            pass
+
+async def _forward_to_daemon(socket_path: str, urls: List[str], auth: bool,
+                             site: Optional[str]) -> Optional[List[bool]]:
+    """
+    Hand the URLs to a running daemon
+    
+    Returns one success flag per URL, or None if no daemon is listening.
+    """
+    if not hasattr(asyncio, 'open_unix_connection') or not os.path.exists(socket_path):
+        return None
+    try:
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+    except OSError:
+        return None
+    
+    logger.info("Forwarding %d competition(s) to daemon at %s", len(urls), socket_path)
+    outcomes = {}
+    try:
+        for url in urls:
+            writer.write((json.dumps({'url': url, 'auth': auth, 'site': site}) + '\n').encode('utf-8'))
+        writer.write_eof()
+        await writer.drain()
+        
+        async for line in reader:
+            reply = json.loads(line)
+            outcomes[reply['url']] = reply['success']
+    finally:
+        writer.close()
+    
+    return [outcomes.get(url, False) for url in urls]
+
+async def main():
+    """Main entry point for the application"""
+    args = _parse_args_fast(sys.argv[1:]) or _parse_args_full()
+    
+    if args.daemon:
+        await _run_daemon(args)
+        return
     
     # If testing with local form
     if args.test:
-        local_form_path = os.path.abspath("test_form.html")
-        if os.path.exists(local_form_path):
-            url = f"file://{local_form_path}"
-            logger.info(f"Running in test mode with local form: {local_form_path}")
+        local_form_url = _local_test_form_url()
+        if local_form_url:
+            urls = [local_form_url]
+            logger.info("Running in test mode with local form: %s", local_form_url)
         else:
             logger.error("Test form not found: test_form.html")
             return
     else:
-        url = args.url
+        urls = args.url
     
-    if not url:
+    if not urls:
         logger.error("No URL provided. Use --url or --test")
         return
     
+    # Reuse a warm daemon's browser if one is running
+    results = await _forward_to_daemon(args.socket or DEFAULT_DAEMON_SOCKET, urls, args.auth, args.site)
+    if results is not None:
+        _log_results(urls, results)
+        return
+    
     # Initialize the auto-entry system
-    auto_entry = CompetitionAutoEntry(config_path=args.config, headless=args.headless)
+    auto_entry = CompetitionAutoEntry(config_path=args.config, headless=args.headless,
+                                      batch_fill=args.batch)
+    
+    transient_errors = _transient_errors()
     
     try:
-        await auto_entry.initialize()
+        _enable_eager_tasks()
+        # Resolve the competition hosts while the browser is starting
+        await asyncio.gather(
+            _initialize_with_retry(auto_entry, transient_errors),
+            auto_entry.warm_dns(urls)
+        )
         
-        # Enter the competition
-        success = await auto_entry.enter_competition(
-            url, 
+        # Enter the competitions
+        results = await auto_entry.enter_competitions(
+            urls,
             needs_auth=args.auth,
-            site=args.site
+            site=args.site,
+            concurrency=args.concurrency
         )
         
-        if success:
-            logger.info("✓ Competition entry successful!")
-        else:
-            logger.warning("✗ Competition entry failed")
+        _log_results(urls, results)
             
-    except Exception as e:
-        logger.error(f"Error: {e}")
+    except transient_errors as e:
+        logger.error("Error: %s", e)
+    except Exception:
+        logger.exception("Fatal error")
     finally:
         await auto_entry.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -10,6 +10,21 @@ from playwright.async_api import async_playwright
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Link patterns to report on, each as a test on a link's href and lowercased
+# text so that every pattern is checked against one read of the page's links.
+# The has-text patterns match case-insensitively, like Playwright's :has-text.
+LINK_PATTERNS = (
+    ('a[href*="/ps/"]', lambda href, text: '/ps/' in href),
+    ('a[href*="ps/"]', lambda href, text: 'ps/' in href),
+    ('a[href*="/index.php"]', lambda href, text: '/index.php' in href),
+    ('a[href*="id="]', lambda href, text: 'id=' in href),
+    ('a:has-text("Win")', lambda href, text: 'win' in text),
+    ('a:has-text("win")', lambda href, text: 'win' in text),
+    ('a:has-text("Enter")', lambda href, text: 'enter' in text),
+    ('a:has-text("Competition")', lambda href, text: 'competition' in text),
+    ('a', lambda href, text: True),  # All links
+)
+
 async def debug_aussiecomps():
     """Debug AussieComps site structure"""
     async with async_playwright() as p:
@@ -29,33 +44,23 @@ async def debug_aussiecomps():
         title = await page.title()
         logger.info(f"Page title: {title}")
         
-        # Check for various link patterns
-        selectors_to_check = [
-            'a[href*="/ps/"]',
-            'a[href*="ps/"]',
-            'a[href*="/index.php"]',
-            'a[href*="id="]',
-            'a:has-text("Win")',
-            'a:has-text("win")',
-            'a:has-text("Enter")',
-            'a:has-text("Competition")',
-            'a',  # All links
-        ]
+        # Read every link once, then check each pattern against that list
+        all_links = await page.eval_on_selector_all(
+            'a', "els => els.map(e => ({href: e.getAttribute('href'), text: e.textContent}))"
+        )
+        for link in all_links:
+            link['text_lower'] = (link['text'] or '').lower()
         
-        for selector in selectors_to_check:
-            try:
-                links = await page.query_selector_all(selector)
-                logger.info(f"Found {len(links)} links with selector: {selector}")
-                
-                # Show first 5 links
-                for i, link in enumerate(links[:5]):
-                    href = await link.get_attribute('href')
-                    text = await link.text_content()
-                    if href and text:
-                        logger.info(f"  Link {i+1}: {text.strip()[:50]} -> {href}")
-                        
-            except Exception as e:
-                logger.error(f"Error with selector {selector}: {e}")
+        for selector, matches in LINK_PATTERNS:
+            links = [link for link in all_links if matches(link['href'] or '', link['text_lower'])]
+            logger.info(f"Found {len(links)} links with selector: {selector}")
+            
+            # Show first 5 links
+            for i, link in enumerate(links[:5]):
+                href = link['href']
+                text = link['text']
+                if href and text:
+                    logger.info(f"  Link {i+1}: {text.strip()[:50]} -> {href}")
         
         # Take a screenshot
         await page.screenshot(path='screenshots/aussiecomps_debug.png')
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Shared Playwright browser for the debug scripts
+
+Launching Chromium dominates the run time of a single debug script, so the
+scripts take a browser context instead of starting their own browser, and
+main_all() runs several of them against one browser in one process.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEBUG_VIEWPORT = {'width': 1920, 'height': 1080}
+DEBUG_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# The browser shared by every shared_browser() user in this process, launched
+# by the first user and closed when the last one exits
+_playwright = None
+_browser = None
+_users = 0
+# Created on first use so it belongs to the running event loop
+_lock = None
+
+@asynccontextmanager
+async def shared_browser(headless=False):
+    """Yield the process-wide Chromium browser, launching it if needed"""
+    global _playwright, _browser, _users, _lock
+
+    if _lock is None:
+        _lock = asyncio.Lock()
+
+    async with _lock:
+        if _browser is None:
+            _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=headless)
+            logger.info("Shared debug browser launched")
+        _users += 1
+
+    try:
+        yield _browser
+    finally:
+        async with _lock:
+            _users -= 1
+            if _users == 0:
+                await _browser.close()
+                await _playwright.stop()
+                _browser = _playwright = None
+
+async def new_debug_context(browser):
+    """Open a context with the desktop viewport and user agent the debug scripts use"""
+    return await browser.new_context(viewport=DEBUG_VIEWPORT, user_agent=DEBUG_USER_AGENT)
+
+async def main_all():
+    """Run the debug scripts concurrently, each in its own context of one browser"""
+    from debug_gleam_forms import debug_gleam_forms
+    from deep_analyze_competition import deep_analyze_competition
+
+    async with shared_browser(headless=False) as browser:
+        contexts = await asyncio.gather(new_debug_context(browser), new_debug_context(browser))
+        # Let every script finish before the browser closes, even if one fails
+        results = await asyncio.gather(
+            debug_gleam_forms(contexts[0]),
+            deep_analyze_competition(contexts[1]),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Debug script failed: {result}")
+
+if __name__ == '__main__':
+    asyncio.run(main_all())
@@ -27,7 +27,7 @@ async def debug_competition_pages():
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         )
         
-        for i, url in enumerate(test_urls):
+        async def analyze(i, url):
             logger.info(f"\n{'='*60}")
             logger.info(f"Analyzing competition {i+1}: {url}")
             logger.info(f"{'='*60}")
@@ -43,14 +43,18 @@ async def debug_competition_pages():
                 logger.info(f"Page title: {title}")
                 
                 # Look for all ps/ links
-                ps_links = await page.query_selector_all('a[href*="ps/"]')
+                ps_links = await page.eval_on_selector_all(
+                    'a[href*="ps/"]',
+                    "els => els.map(e => ({href: e.getAttribute('href'), text: e.textContent, "
+                    "id: e.getAttribute('id'), class: e.getAttribute('class')}))"
+                )
                 logger.info(f"Found {len(ps_links)} ps/ links")
                 
                 for j, link in enumerate(ps_links):
-                    href = await link.get_attribute('href')
-                    text = await link.text_content()
-                    link_id = await link.get_attribute('id')
-                    link_class = await link.get_attribute('class')
+                    href = link['href']
+                    text = link['text']
+                    link_id = link['id']
+                    link_class = link['class']
                     
                     logger.info(f"  Link {j+1}: {text[:50] if text else 'No text'} -> {href}")
                     if link_id:
@@ -59,32 +63,37 @@ async def debug_competition_pages():
                         logger.info(f"    Class: {link_class}")
                 
                 # Look for entry buttons or forms
-                entry_buttons = await page.query_selector_all('input[type="submit"], button[type="submit"], button:has-text("Enter"), a:has-text("Enter")')
+                entry_buttons = await page.eval_on_selector_all(
+                    'input[type="submit"], button[type="submit"], button:has-text("Enter"), a:has-text("Enter")',
+                    "els => els.map(e => ({text: e.textContent, type: e.getAttribute('type'), href: e.getAttribute('href')}))"
+                )
                 logger.info(f"Found {len(entry_buttons)} potential entry buttons")
                 
                 for j, button in enumerate(entry_buttons):
-                    text = await button.text_content()
-                    button_type = await button.get_attribute('type')
-                    href = await button.get_attribute('href')
+                    text = button['text']
+                    button_type = button['type']
+                    href = button['href']
                     logger.info(f"  Button {j+1}: {text[:50] if text else 'No text'} (type: {button_type}, href: {href})")
                 
                 # Look for forms
-                forms = await page.query_selector_all('form')
+                forms = await page.eval_on_selector_all(
+                    'form',
+                    "els => els.map(e => ({action: e.getAttribute('action'), method: e.getAttribute('method'), "
+                    "inputs: e.querySelectorAll('input, textarea, select').length}))"
+                )
                 logger.info(f"Found {len(forms)} forms")
                 
                 for j, form in enumerate(forms):
-                    action = await form.get_attribute('action')
-                    method = await form.get_attribute('method')
-                    inputs = await form.query_selector_all('input, textarea, select')
-                    logger.info(f"  Form {j+1}: action={action}, method={method}, inputs={len(inputs)}")
+                    logger.info(f"  Form {j+1}: action={form['action']}, method={form['method']}, inputs={form['inputs']}")
                 
                 # Look for competition-specific entry links
-                competition_links = await page.query_selector_all('a[href*="id="]')
+                competition_links = await page.eval_on_selector_all(
+                    'a[href*="id="]', "els => els.map(e => e.getAttribute('href'))"
+                )
                 logger.info(f"Found {len(competition_links)} competition-specific links")
                 
                 unique_links = set()
-                for link in competition_links:
-                    href = await link.get_attribute('href')
+                for href in competition_links:
                     if href and 'id=' in href:
                         unique_links.add(href)
                 
@@ -101,9 +110,9 @@ async def debug_competition_pages():
             
             finally:
                 await page.close()
-            
-            # Wait a bit between pages
-            await asyncio.sleep(2)
+        
+        # Each URL gets its own page in the shared context, so they load concurrently
+        await asyncio.gather(*(analyze(i, url) for i, url in enumerate(test_urls)))
         
         input("Press Enter to continue...")
         await browser.close()
@@ -33,6 +33,17 @@ if sys.platform == "win32":
     if hasattr(sys.stderr, 'detach'):
         sys.stderr = codecs.getwriter("utf-8")(sys.stderr.detach())
 
+# Reads the attributes used to classify a form field in one call
+ELEMENT_PROPS_JS = """
+    el => ({
+        name: el.getAttribute('name') || '',
+        placeholder: el.getAttribute('placeholder') || '',
+        type: el.getAttribute('type') || 'text',
+        id: el.getAttribute('id') || '',
+        tag: el.tagName.toLowerCase()
+    })
+"""
+
 async def enter_direct_competition(url: str, headless: bool = False):
     """
     Enter a competition form directly without authentication
@@ -194,11 +205,13 @@ async def detect_form_fields(page: Page) -> List[Dict]:
         
         for input_elem in inputs:
             try:
-                # Get element properties
-                name = await input_elem.get_attribute('name') or ''
-                placeholder = await input_elem.get_attribute('placeholder') or ''
-                input_type = await input_elem.get_attribute('type') or 'text'
-                tag_name = await input_elem.evaluate('el => el.tagName.toLowerCase()')
+                # Get element properties in a single round-trip
+                props = await input_elem.evaluate(ELEMENT_PROPS_JS)
+                name = props['name']
+                placeholder = props['placeholder']
+                input_type = props['type']
+                input_id = props['id']
+                tag_name = props['tag']
                 
                 # Get element position
                 box = await input_elem.bounding_box()
@@ -209,7 +222,6 @@ async def detect_form_fields(page: Page) -> List[Dict]:
                 label_text = ''
                 try:
                     # Look for label by 'for' attribute
-                    input_id = await input_elem.get_attribute('id')
                     if input_id:
                         label = await page.query_selector(f'label[for="{input_id}"]')
                         if label:
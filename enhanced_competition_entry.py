@@ -14,7 +14,7 @@ from typing import Dict, List, Optional, Tuple, Any
 import sqlite3
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -38,6 +38,60 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Lowercase keywords marking a discovered link as a competition
+COMPETITION_LINK_KEYWORDS = ('win', 'prize', 'competition', 'enter', 'free')
+
+# Lowercase phrases on the page after submitting that suggest the entry went through
+SUBMISSION_SUCCESS_INDICATORS = ('thank you', 'success', 'submitted', 'entered', 'confirmation')
+
+# Bytes read from the response per parser feed during traditional discovery
+DISCOVERY_CHUNK_SIZE = 32768
+
+class LinkCollector:
+    """
+    lxml parser target collecting (href, text) for every link with an href
+    
+    The page is fed to the parser as it downloads, so no tree is built and the
+    whole document is never held in memory. Link text matches BeautifulSoup's
+    get_text(strip=True): each text node stripped, then joined.
+    """
+    
+    def __init__(self):
+        self.links = []
+        self._href = None
+        self._parts = []
+        # Text arrives in pieces that may split a text node across feeds
+        self._pending = []
+    
+    def _flush_text(self):
+        text = ''.join(self._pending).strip()
+        if text:
+            self._parts.append(text)
+        self._pending = []
+    
+    def start(self, tag, attrib):
+        if self._href is not None:
+            self._flush_text()
+        elif tag == 'a' and 'href' in attrib:
+            self._href = attrib['href']
+            self._parts = []
+            self._pending = []
+    
+    def end(self, tag):
+        if self._href is None:
+            return
+        self._flush_text()
+        if tag == 'a':
+            self.links.append((self._href, ''.join(self._parts)))
+            self._href = None
+    
+    def data(self, data):
+        if self._href is not None:
+            self._pending.append(data)
+    
+    def close(self):
+        return self.links
+
 class MCPBrowserAutomation:
     """
     Integration with MCP browser automation servers for reliable form interaction
@@ -412,17 +466,19 @@ class EnhancedCompetitionEntry:
     async def _traditional_discovery(self, source_url: str) -> List[Dict]:
         """Traditional web scraping as backup method"""
         try:
-            response = requests.get(source_url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Parse the page as it streams in, collecting only the links we look at
+            parser = etree.HTMLParser(target=LinkCollector())
+            with requests.get(source_url, timeout=10, stream=True) as response:
+                for chunk in response.iter_content(DISCOVERY_CHUNK_SIZE):
+                    parser.feed(chunk)
+            links = parser.close()
             
             competitions = []
             
             # Look for competition links
-            for link in soup.find_all('a', href=True):
-                href = link.get('href')
-                text = link.get_text(strip=True)
-                
-                if any(keyword in text.lower() for keyword in ['win', 'prize', 'competition', 'enter', 'free']):
+            for href, text in links:
+                text_lower = text.lower()
+                if any(keyword in text_lower for keyword in COMPETITION_LINK_KEYWORDS):
                     if href.startswith('/'):
                         href = f"{source_url.rstrip('/')}{href}"
                     elif not href.startswith('http'):
@@ -649,10 +705,8 @@ class EnhancedCompetitionEntry:
                 pass  # Continue even if timeout
             
             # Check for success indicators
-            page_content = await page.content()
-            success_indicators = ['thank you', 'success', 'submitted', 'entered', 'confirmation']
-            
-            is_success = any(indicator in page_content.lower() for indicator in success_indicators)
+            page_content = (await page.content()).lower()
+            is_success = any(indicator in page_content for indicator in SUBMISSION_SUCCESS_INDICATORS)
             
             return {
                 'submitted': True,
@@ -40,6 +40,22 @@ import structlog
 logger.remove()
 logger.add("logs/competition_mcp_{time}.log", rotation="1 day", retention="7 days")
 
+# Lowercase phrases checked on the page after submitting a form
+SUBMISSION_SUCCESS_INDICATORS = (
+    "thank you",
+    "success",
+    "submitted",
+    "confirmation",
+    "entered successfully",
+)
+SUBMISSION_ERROR_INDICATORS = (
+    "error",
+    "failed",
+    "invalid",
+    "required field",
+    "please complete",
+)
+
 class CompetitionStatus(Enum):
     DISCOVERED = "discovered"
     ANALYZING = "analyzing"
@@ -386,33 +402,16 @@ class MCPBrowserAutomation:
             await asyncio.sleep(3)
             
             # Check for success indicators
-            success_indicators = [
-                "thank you",
-                "success",
-                "submitted",
-                "confirmation",
-                "entered successfully"
-            ]
-            
-            page_content = await self.page.content()
-            for indicator in success_indicators:
-                if indicator in page_content.lower():
-                    logger.info("Form submission successful")
-                    return True
+            page_content = (await self.page.content()).lower()
+            if any(indicator in page_content for indicator in SUBMISSION_SUCCESS_INDICATORS):
+                logger.info("Form submission successful")
+                return True
             
             # Check for error indicators
-            error_indicators = [
-                "error",
-                "failed",
-                "invalid",
-                "required field",
-                "please complete"
-            ]
-            
-            for indicator in error_indicators:
-                if indicator in page_content.lower():
-                    logger.warning(f"Form submission failed: {indicator}")
-                    return False
+            error = next((i for i in SUBMISSION_ERROR_INDICATORS if i in page_content), None)
+            if error:
+                logger.warning(f"Form submission failed: {error}")
+                return False
             
             return True  # Assume success if no clear indicators
             
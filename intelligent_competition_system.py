@@ -21,6 +21,28 @@ from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Text on a page, URL or title suggesting the entry went through
+SUCCESS_INDICATORS = (
+    'thank you', 'thanks', 'entered', 'submission received',
+    'success', 'confirmed', 'complete', 'registered', 'entry recorded',
+    'good luck', 'congratulations'
+)
+
+# Selectors for competition links on aggregator pages, tried in order
+DISCOVERY_SELECTORS = (
+    'a:has-text("Win")',  # AussieComps main pattern
+    'a[href*="/index.php?id="]',  # AussieComps URL pattern
+    'a[href*="/ps/"]',  # AussieComps ps/ pattern
+    'a[href*="/competition/"]',
+    'a[href*="/comp/"]',
+    'a[href*="enter"]',
+    'a[href*="win"]',
+    '.competition-link a',
+    '.comp-link a'
+)
+# Reads the href and text of every link matched by a selector in one call
+LINK_HREF_TEXT_JS = "els => els.map(e => [e.getAttribute('href'), e.textContent])"
+
 class DecisionNode:
     """Symbolic decision node for backtracking and learning"""
     def __init__(self, node_id: str, page_url: str, screenshot_path: str, 
@@ -92,6 +114,7 @@ class AdaptiveCompetitionEntry:
     def __init__(self, config_path: str = "config/config.json", headless: bool = False):
         self.config_path = config_path
         self.headless = headless
+        self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.personal_info = {}
@@ -128,9 +151,9 @@ class AdaptiveCompetitionEntry:
 
     async def initialize(self):
         """Initialize browser"""
-        playwright = await async_playwright().start()
+        self.playwright = await async_playwright().start()
         
-        self.browser = await playwright.chromium.launch(
+        self.browser = await self.playwright.chromium.launch(
             headless=self.headless,
             args=['--no-sandbox', '--disable-dev-shm-usage']
         )
@@ -147,6 +170,16 @@ class AdaptiveCompetitionEntry:
         if self.browser:
             await self.browser.close()
             logger.info("Browser closed")
+        if self.playwright:
+            await self.playwright.stop()
+
+    async def __aenter__(self):
+        """Start the browser, so one instance can be reused across aggregators"""
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
 
     async def create_decision_node(self, page: Page, decision_type: str, description: str) -> DecisionNode:
         """Create a new decision node with analysis"""
@@ -967,25 +1000,16 @@ class AdaptiveCompetitionEntry:
             page_text = await page.text_content('body')
             title = await page.title()
             
-            success_indicators = [
-                'thank you', 'thanks', 'entered', 'submission received',
-                'success', 'confirmed', 'complete', 'registered', 'entry recorded',
-                'good luck', 'congratulations'
-            ]
-            
             page_text_lower = page_text.lower()
             url_lower = current_url.lower()
             title_lower = title.lower()
             
             # Check for success indicators in text, URL, or title
-            has_success_indicator = False
-            for indicator in success_indicators:
-                if (indicator in page_text_lower or 
-                    indicator in url_lower or 
-                    indicator in title_lower):
-                    logger.info(f"Success indicator found: {indicator}")
-                    has_success_indicator = True
-                    break
+            indicator = next((i for i in SUCCESS_INDICATORS
+                              if i in page_text_lower or i in url_lower or i in title_lower), None)
+            has_success_indicator = indicator is not None
+            if has_success_indicator:
+                logger.info(f"Success indicator found: {indicator}")
             
             # If we're on a competition platform, check if there are forms that need filling
             platform_domains = ['gleam.io', 'woobox.com', 'rafflecopter.com', 'viralsweep.com', 'kingsumo.com']
@@ -1188,25 +1212,10 @@ class AdaptiveCompetitionEntry:
             competitions = []
             
             # Look for competition links using various patterns
-            selectors = [
-                'a:has-text("Win")',  # AussieComps main pattern
-                'a[href*="/index.php?id="]',  # AussieComps URL pattern
-                'a[href*="/ps/"]',  # AussieComps ps/ pattern
-                'a[href*="/competition/"]',
-                'a[href*="/comp/"]', 
-                'a[href*="enter"]',
-                'a[href*="win"]',
-                '.competition-link a',
-                '.comp-link a'
-            ]
-            
-            for selector in selectors:
+            for selector in DISCOVERY_SELECTORS:
                 try:
-                    links = await page.query_selector_all(selector)
-                    for link in links:
-                        href = await link.get_attribute('href')
-                        text = await link.text_content()
-                        
+                    links = await page.eval_on_selector_all(selector, LINK_HREF_TEXT_JS)
+                    for href, text in links:
                         if href and text and self._is_valid_competition_link(text, href):
                             if not href.startswith('http'):
                                 href = urljoin(aggregator_url, href)
@@ -11,6 +11,44 @@ from intelligent_competition_system import AdaptiveCompetitionEntry
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of aggregators tested at once, each in its own pages of the shared browser
+AGGREGATOR_CONCURRENCY = 3
+
+async def check_aggregator(system, url):
+    """Discover competitions on one aggregator and process the first few"""
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Testing aggregator: {url}")
+    logger.info(f"{'='*60}")
+    
+    try:
+        # Test discovery
+        competitions = await system.discover_competitions(url)
+        logger.info(f"Discovered {len(competitions)} competitions")
+        
+        if not competitions:
+            logger.warning("No competitions found - check discovery logic")
+            return
+        
+        # Test processing first 3 competitions
+        for i, comp in enumerate(competitions[:3]):
+            logger.info(f"\nProcessing competition {i+1}: {comp['title']}")
+            
+            try:
+                success = await system.process_competition_adaptively(comp['url'], comp['title'])
+                if success:
+                    logger.info(f"✅ Success: {comp['title']}")
+                else:
+                    logger.warning(f"❌ Failed: {comp['title']}")
+                    
+            except Exception as e:
+                logger.error(f"❌ Error processing {comp['title']}: {e}")
+            
+            # Small delay between competitions
+            await asyncio.sleep(2)
+        
+    except Exception as e:
+        logger.error(f"Error testing {url}: {e}")
+
 async def test_comprehensive_scenarios():
     """Test various competition scenarios"""
     
@@ -20,46 +58,16 @@ async def test_comprehensive_scenarios():
         # Could add more aggregators later
     ]
     
-    for url in test_urls:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Testing aggregator: {url}")
-        logger.info(f"{'='*60}")
-        
-        system = AdaptiveCompetitionEntry(headless=False)
+    # One browser is started and shared by every aggregator; each opens its own
+    # pages in it, and the semaphore bounds how many are tested at once
+    semaphore = asyncio.Semaphore(AGGREGATOR_CONCURRENCY)
+    
+    async with AdaptiveCompetitionEntry(headless=False) as system:
+        async def run(url):
+            async with semaphore:
+                await check_aggregator(system, url)
         
-        try:
-            await system.initialize()
-            
-            # Test discovery
-            competitions = await system.discover_competitions(url)
-            logger.info(f"Discovered {len(competitions)} competitions")
-            
-            if not competitions:
-                logger.warning("No competitions found - check discovery logic")
-                continue
-            
-            # Test processing first 3 competitions
-            for i, comp in enumerate(competitions[:3]):
-                logger.info(f"\nProcessing competition {i+1}: {comp['title']}")
-                
-                try:
-                    success = await system.process_competition_adaptively(comp['url'], comp['title'])
-                    if success:
-                        logger.info(f"✅ Success: {comp['title']}")
-                    else:
-                        logger.warning(f"❌ Failed: {comp['title']}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error processing {comp['title']}: {e}")
-                
-                # Small delay between competitions
-                await asyncio.sleep(2)
-            
-        except Exception as e:
-            logger.error(f"Error testing {url}: {e}")
-            
-        finally:
-            await system.close()
+        await asyncio.gather(*(run(url) for url in test_urls))
     
     logger.info("\n" + "="*60)
     logger.info("Comprehensive testing completed")